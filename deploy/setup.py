@@ -139,7 +139,11 @@ configTemplateVars: typing.Dict = \
                                                           'min-split-size': '10M', 'seed-time': '0.01', 'split': '10'},
      'authorizedChats': {}, 'dlRootDir': 'dl', 'logLevel': 'INFO', 'megaAuth': {'apiKey': '', 'emailId': '', 'passPhrase': ''},
      'statusUpdateInterval': '5', 'trackersListUrl': 'https://trackerslist.com/all_aria2.txt',
-     'ytdlFormat': 'best/bestvideo+bestaudio'}
+     'ytdlFormat': 'best/bestvideo+bestaudio', 'megaUploadFolderPath': '/', 'megaUploadLimit': '4',
+     'megaAuthList': [], 'telegramUploadLimit': '4',
+     'telegramWorkerBotTokens': [], 'ytdlAriaDownload': 'false',
+     'compressionEngine': 'zstd', 'streamArchive': 'false',
+     'compressionVolumeSize': '0'}
 envVars: typing.Dict = {'dlWaitTime': '5'}
 
 if __name__ == '__main__':
@@ -5,6 +5,8 @@
 # TODO: Code for direct link generation
 import aria2p
 import asyncio
+import collections
+import concurrent.futures
 import copy
 import googleapiclient.discovery
 import googleapiclient.errors
@@ -13,10 +15,12 @@ import google.auth.transport.requests
 import google.oauth2.credentials
 import google.oauth2.service_account
 import hashlib
+import html
 import json
 import logging
 import loguru
 import magic
+import math
 import mega
 import os
 import psutil
@@ -24,21 +28,27 @@ import random
 import re
 import requests
 import shutil
+import shlex
 import signal
+import socket
 import string
 import subprocess
 import sys
+import tarfile
 import time
 import telegram
 import telegram.ext
+import telegram.utils.request
 import threading
 import tornado.httputil
 import tornado.httpserver
 import tornado.ioloop
 import tornado.web
 import typing
+import urllib.parse
 import warnings
 import youtube_dl
+import zipfile
 
 
 class BotWrapper:
@@ -122,6 +132,8 @@ class BotHelper(BaseHelper):
         self.mirrorListenerHelper.initHelper()
 
     def addAllHandlers(self) -> None:
+        self.dispatcher.add_handler(self.ariaHelper.fileSelectHandler)
+        self.dispatcher.add_handler(self.statusHelper.statusPageHandler)
         for cmdHandler in self.botCmdHelper.cmdHandlers:
             self.dispatcher.add_handler(cmdHandler)
         for convHandler in self.botConvHelper.convHandlers:
@@ -129,10 +141,13 @@ class BotHelper(BaseHelper):
         unknownHandler = telegram.ext.MessageHandler(filters=telegram.ext.Filters.command,
                                                      callback=self.botCmdHelper.unknownCallBack, run_async=True)
         self.dispatcher.add_handler(unknownHandler)
+        # separate group, every media message is seen regardless of the command and conversation handlers
+        self.dispatcher.add_handler(self.telegramHelper.mediaGroupHandler, group=1)
 
     def botRestart(self) -> None:
         self.ariaHelper.api.remove_all(force=True)
         self.cleanDlRootDir()
+        self.telegramHelper.fileIdCacheSave()
         self.logger.info('Restarting the Bot...')
         restartJsonDict = {'restartMsgInfo': self.restartMsgInfo, 'ariaRpcSecret': self.ariaHelper.rpcSecret,
                            'ariaDaemonPid': self.ariaHelper.daemonPid, 'botApiServerPid': self.telegramHelper.apiServerPid}
@@ -147,13 +162,14 @@ class BotHelper(BaseHelper):
         self.telegramHelper.apiServerStart()
         self.ariaHelper.daemonCheck()
         self.telegramHelper.apiServerCheck()
+        self.telegramHelper.initUploadBots()
         self.ariaHelper.dlTrackersList()
         self.ariaHelper.globalOptsGet()
         self.ariaHelper.globalOptsSet()
         self.ariaHelper.startListener()
         self.megaHelper.addListener()
         self.googleDriveHelper.authorizeApi()
-        self.megaHelper.authorizeApi()
+        self.threadingHelper.initThread(target=self.megaHelper.authorizeApi, name='MegaHelper.authorizeApi')
         self.addAllHandlers()
         self.updaterStart()
         self.mirrorListenerHelper.startWebhookServer()
@@ -208,12 +224,16 @@ class ConfigHelper(BaseHelper):
         self.reqVars: [str] = ['botToken', 'botOwnerId', 'telegramApiId', 'telegramApiHash',
                                'googleDriveAuth', 'googleDriveUploadFolderIds']
         self.optVars: typing.List[str] = ['ariaGlobalOpts', 'authorizedChats', 'dlRootDir', 'logLevel',
-                                          'megaAuth', 'statusUpdateInterval', 'trackersListUrl', 'ytdlFormat']
+                                          'megaAuth', 'statusUpdateInterval', 'trackersListUrl', 'ytdlFormat',
+                                          'megaUploadFolderPath', 'megaUploadLimit', 'megaAuthList', 'telegramUploadLimit',
+                                          'telegramWorkerBotTokens', 'ytdlAriaDownload',
+                                          'compressionEngine', 'streamArchive', 'compressionVolumeSize']
         self.optVals: typing.List[typing.Union[str, typing.Dict]] = \
             [{'allow-overwrite': 'true', 'bt-max-peers': '0', 'follow-torrent': 'mem',
               'max-connection-per-server': '8', 'max-overall-upload-limit': '1K',
               'min-split-size': '10M', 'seed-time': '0.01', 'split': '10'},
-             {}, 'dl', 'INFO', {}, '5', 'https://trackerslist.com/all_aria2.txt', 'best/bestvideo+bestaudio']
+             {}, 'dl', 'INFO', {}, '5', 'https://trackerslist.com/all_aria2.txt', 'best/bestvideo+bestaudio',
+             '/', '4', [], '4', [], 'false', 'zstd', 'false', '0']
         self.emptyVals: typing.List[typing.Union[str, typing.Dict]] = ['', ' ', {}]
         self.isFixConfigJson: bool = False
         self.configVarsLoad()
@@ -395,6 +415,9 @@ class GetHelper(BaseHelper):
                 size += os.path.getsize(os.path.join(path, file))
         return size
 
+    def pathSize(self, path: str) -> int:
+        return self.folderSize(path) if os.path.isdir(path) else os.path.getsize(path)
+
     def progressBar(self, progress: float) -> str:
         progressRounded = round(progress)
         numFull = progressRounded // 8
@@ -448,6 +471,7 @@ class GetHelper(BaseHelper):
                    f'Free: {self.readableSize(diskUsageFree)}\n' \
                    f'dataDown: {self.readableSize(psutil.net_io_counters().bytes_recv)} | ' \
                    f'dataUp: {self.readableSize(psutil.net_io_counters().bytes_sent)}\n'
+        statsMsg += self.botHelper.megaHelper.statsMsg()
         return statsMsg
 
 
@@ -515,9 +539,10 @@ class ThreadingHelper(BaseHelper):
         super().initHelper()
         self.runningThreads: typing.List[threading.Thread] = []
 
-    def initThread(self, target: typing.Callable, name: str, *args: object, **kwargs: object) -> None:
+    def initThread(self, target: typing.Callable, name: str, *args: object, **kwargs: object) -> threading.Thread:
         thread = threading.Thread(target=self.wrapThread, name=name, args=(target,) + args, kwargs=kwargs, )
         thread.start()
+        return thread
 
     def wrapThread(self, target: typing.Callable, *args: object, **kwargs: object) -> None:
         currentThread = threading.current_thread()
@@ -797,7 +822,8 @@ class ConfigConvHelper(BaseHelper):
         self.configVarsEditable = self.botHelper.configHelper.jsonFileLoad(self.botHelper.configHelper.configJsonFile)
         for key in [self.botHelper.configHelper.reqVars[4], self.botHelper.configHelper.reqVars[5],
                     self.botHelper.configHelper.optVars[0], self.botHelper.configHelper.optVars[1],
-                    self.botHelper.configHelper.optVars[4]]:
+                    self.botHelper.configHelper.optVars[4], self.botHelper.configHelper.optVars[10],
+                    self.botHelper.configHelper.optVars[12]]:
             if key in list(self.configVarsEditable.keys()):
                 self.configVarsEditable.pop(key)
 
@@ -928,7 +954,7 @@ class MirrorConvHelper(BaseHelper):
         super().initHelper()
         self.isValidDl: bool
         self.mirrorInfo: MirrorInfo
-        self.FIRST, self.SECOND, self.THIRD, self.FOURTH, self.FIFTH = range(5)
+        self.FIRST, self.SECOND, self.THIRD, self.FOURTH, self.FIFTH, self.SIXTH = range(6)
         # TODO: filter - restrict to user who sent MirrorCommand
         self.cmdHandler = telegram.ext.CommandHandler(self.botHelper.botCmdHelper.MirrorCmd.command, self.stageZero)
         self.handler = telegram.ext.ConversationHandler(entry_points=[self.cmdHandler], fallbacks=[self.cmdHandler],
@@ -943,7 +969,9 @@ class MirrorConvHelper(BaseHelper):
                                                             # Choose Compress / Decompress
                                                             self.FOURTH: [telegram.ext.CallbackQueryHandler(self.stageFour)],
                                                             # Confirm and Proceed / Cancel
-                                                            self.FIFTH: [telegram.ext.CallbackQueryHandler(self.stageFive)]
+                                                            self.FIFTH: [telegram.ext.CallbackQueryHandler(self.stageFive)],
+                                                            # Choose compressionEngine
+                                                            self.SIXTH: [telegram.ext.CallbackQueryHandler(self.stageSix)]
                                                         },
                                                         conversation_timeout=120, run_async=True)
 
@@ -955,8 +983,13 @@ class MirrorConvHelper(BaseHelper):
             self.mirrorInfo.googleDriveUploadFolderId = \
                 list(self.botHelper.configHelper.configVars[self.botHelper.configHelper.reqVars[5]].keys())[0]
             # </setDefaults>
+            if self.mirrorInfo.isYouTubeDownload:
+                self.botHelper.youTubeHelper.preExtract(self.mirrorInfo.downloadUrl)
+            buttonList = ['Use Defaults', 'Customize']
+            if self.mirrorInfo.isAriaDownload and self.botHelper.ariaHelper.isTorrentSource(self.mirrorInfo):
+                buttonList += ['Use Defaults and Select Files']
             update.message.reply_text(text=self.getMirrorInfoStr(), reply_to_message_id=update.message.message_id,
-                                      reply_markup=InlineKeyboardMaker(['Use Defaults', 'Customize']).build(1))
+                                      reply_markup=InlineKeyboardMaker(buttonList).build(1))
             return self.FIRST
         if not self.isValidDl:
             update.message.reply_text(text='No Valid Link Provided !', reply_to_message_id=update.message.message_id)
@@ -965,7 +998,9 @@ class MirrorConvHelper(BaseHelper):
     def stageOne(self, update: telegram.Update, _: telegram.ext.CallbackContext) -> int:
         query = update.callback_query
         query.answer()
-        if query.data == '1':
+        if query.data in ['1', '3']:
+            if query.data == '3':
+                self.mirrorInfo.isSelectFiles = True
             self.logger.info(f"addMirror - ({self.mirrorInfo.uid}) ['{self.mirrorInfo.downloadUrl}']")
             self.botHelper.mirrorHelper.addMirror(self.mirrorInfo)
             query.edit_message_text(text='addMirror Succeeded !')
@@ -1007,16 +1042,32 @@ class MirrorConvHelper(BaseHelper):
         query.answer()
         if query.data == '1':
             self.mirrorInfo.isCompress = True
+            buttonList = list(self.botHelper.compressionHelper.compressionEngines.keys())
+            query.edit_message_text(text='Choose `compressionEngine`:', reply_markup=InlineKeyboardMaker(buttonList).build(1))
+            return self.SIXTH
         elif query.data == '2':
             self.mirrorInfo.isDecompress = True
+        return self.confirmMirror(query)
+
+    def stageSix(self, update: telegram.Update, _: telegram.ext.CallbackContext) -> int:
+        query = update.callback_query
+        query.answer()
+        self.mirrorInfo.compressionEngine = list(self.botHelper.compressionHelper.compressionEngines.keys())[(int(query.data) - 1)]
+        return self.confirmMirror(query)
+
+    def confirmMirror(self, query: telegram.CallbackQuery) -> int:
         buttonList = ['Proceed', 'Cancel']
+        if self.mirrorInfo.isAriaDownload and self.botHelper.ariaHelper.isTorrentSource(self.mirrorInfo):
+            buttonList += ['Proceed and Select Files']
         query.edit_message_text(text=self.getMirrorInfoStr(), reply_markup=InlineKeyboardMaker(buttonList).build(1))
         return self.FIFTH
 
     def stageFive(self, update: telegram.Update, _: telegram.ext.CallbackContext) -> int:
         query = update.callback_query
         query.answer()
-        if query.data == '1':
+        if query.data in ['1', '3']:
+            if query.data == '3':
+                self.mirrorInfo.isSelectFiles = True
             self.logger.info(f"addMirror - ['{self.mirrorInfo.downloadUrl}']")
             self.botHelper.mirrorHelper.addMirror(self.mirrorInfo)
             query.edit_message_text(text='addMirror Succeeded !')
@@ -1043,10 +1094,15 @@ class MirrorConvHelper(BaseHelper):
             mirrorInfoStr += f'[isMegaUpload | True]\n'
         elif self.mirrorInfo.isTelegramUpload:
             mirrorInfoStr += f'[isTelegramUpload | True]\n'
+        if self.mirrorInfo.isSelectFiles:
+            mirrorInfoStr += f'[isSelectFiles | True]\n'
         if self.mirrorInfo.isCompress:
             mirrorInfoStr += f'[isCompress | True]\n'
+            mirrorInfoStr += f'[compressionEngine | {self.mirrorInfo.compressionEngine}]\n'
         elif self.mirrorInfo.isDecompress:
             mirrorInfoStr += f'[isDecompress | True]\n'
+        if (self.mirrorInfo.isCompress or self.mirrorInfo.isDecompress) and self.mirrorInfo.isStreamArchive and not self.mirrorInfo.isMegaUpload:
+            mirrorInfoStr += f'[isStreamArchive | True]\n'
         if self.mirrorInfo.isGoogleDriveUpload:
             mirrorInfoStr += f'[googleDriveUploadFolderId | {self.mirrorInfo.googleDriveUploadFolderId}]'
         return mirrorInfoStr
@@ -1059,8 +1115,6 @@ class MirrorHelper(BaseHelper):
     def initHelper(self) -> None:
         super().initHelper()
         self.mirrorInfos: typing.Dict[str, MirrorInfo] = {}
-        self.supportedArchiveFormats: typing.Dict[str, str] = {'zip': '.zip', 'tar': '.tar', 'bztar': '.tar.bz2',
-                                                               'gztar': '.tar.gz', 'xztar': '.tar.xz'}
 
     def addMirror(self, mirrorInfo: 'MirrorInfo') -> None:
         self.logger.debug(vars(mirrorInfo))
@@ -1146,16 +1200,167 @@ class AriaHelper(BaseHelper):
         self.globalOpts: aria2p.Options
         self.trackersListFile = 'trackers.list'
         self.gids: typing.Dict[str, str] = {}
+        self.fileSelects: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        self.fileSelectPageSize: int = 10
+        self.fileSelectTimeout: int = 300
+        self.fileSelectLock = threading.Lock()
+        self.fileSelectHandler = telegram.ext.CallbackQueryHandler(callback=self.fileSelectCallBack, pattern=r'^fileSelect\|', run_async=True)
 
     def addDownload(self, mirrorInfo: 'MirrorInfo') -> None:
+        dlOpts: typing.Dict[str, str] = {'dir': mirrorInfo.path}
+        if mirrorInfo.isSelectFiles:
+            # followed download stays paused until files are chosen in fileSelectCallBack()
+            dlOpts['pause-metadata'] = 'true'
+            self.fileSelects[mirrorInfo.uid] = {}
         if re.findall(UrlRegex.bittorrentMagnet, mirrorInfo.downloadUrl):
-            self.gids[mirrorInfo.uid] = self.api.add_magnet(mirrorInfo.downloadUrl, options={'dir': mirrorInfo.path}).gid
-        if re.findall(UrlRegex.generalUrl, mirrorInfo.downloadUrl):
-            self.gids[mirrorInfo.uid] = self.api.add_uris([mirrorInfo.downloadUrl], options={'dir': mirrorInfo.path}).gid
+            self.gids[mirrorInfo.uid] = self.api.add_magnet(mirrorInfo.downloadUrl, options=dlOpts).gid
+        elif re.findall(UrlRegex.generalUrl, mirrorInfo.downloadUrl):
+            self.gids[mirrorInfo.uid] = self.api.add_uris([mirrorInfo.downloadUrl], options=dlOpts).gid
+        elif os.path.isfile(mirrorInfo.downloadUrl):
+            # replied torrent documents are local files on botApiServer, their metadata is known right away
+            if mirrorInfo.isSelectFiles:
+                dlOpts['pause'] = 'true'
+            self.gids[mirrorInfo.uid] = self.api.add_torrent(mirrorInfo.downloadUrl, options=dlOpts).gid
+            if mirrorInfo.isSelectFiles:
+                self.fileSelectStart(mirrorInfo.uid)
 
     def cancelDownload(self, uid: str) -> None:
         self.getDlObj(self.gids[uid]).remove(force=True, files=True)
         self.gids.pop(uid)
+        fileSelect = self.fileSelects.pop(uid, None)
+        if fileSelect and fileSelect.get('timer'):
+            fileSelect['timer'].cancel()
+
+    @staticmethod
+    def isTorrentSource(mirrorInfo: 'MirrorInfo') -> bool:
+        if re.findall(UrlRegex.bittorrentMagnet, mirrorInfo.downloadUrl) or mirrorInfo.downloadUrl.split('?')[0].endswith('.torrent'):
+            return True
+        replyTo = mirrorInfo.msg.reply_to_message
+        # replied torrent documents are offered only when botApiServer exposes them as local files for add_torrent()
+        return bool(replyTo and replyTo.document and replyTo.document.mime_type == 'application/x-bittorrent'
+                    and os.path.isfile(mirrorInfo.downloadUrl))
+
+    def fileSelectStart(self, uid: str) -> None:
+        mirrorInfo = self.botHelper.mirrorHelper.mirrorInfos[uid]
+        dlObj = self.getDlObj(self.gids[uid])
+        dlFiles: typing.List[typing.Tuple[int, str, int]] = \
+            [(dlFile.index, os.path.relpath(str(dlFile.path), mirrorInfo.path), dlFile.length) for dlFile in dlObj.files]
+        # paused download holds a download queue slot, so an unanswered selection falls back to all files
+        selectTimer = threading.Timer(self.fileSelectTimeout, self.fileSelectExpire, args=[uid])
+        selectTimer.daemon = True
+        self.fileSelects[uid] = {'files': dlFiles, 'selected': set(dlFile[0] for dlFile in dlFiles), 'page': 0, 'msgId': 0,
+                                 'isFinished': False, 'timer': selectTimer}
+        self.logger.info(f'{uid} : Waiting for File Selection ({len(dlFiles)} Files)')
+        self.fileSelects[uid]['msgId'] = \
+            self.botHelper.bot.sendMessage(text=self.fileSelectTxt(uid), parse_mode='HTML', reply_markup=self.fileSelectMarkup(uid),
+                                           chat_id=mirrorInfo.chatId, reply_to_message_id=mirrorInfo.msgId).message_id
+        selectTimer.start()
+
+    def fileSelectTxt(self, uid: str) -> str:
+        fileSelect = self.fileSelects[uid]
+        numPages = ((len(fileSelect['files']) - 1) // self.fileSelectPageSize) + 1
+        selectedSize = sum([dlFile[2] for dlFile in fileSelect['files'] if dlFile[0] in fileSelect['selected']])
+        return f'<code>{uid}</code> | Select Files\n' \
+               f"Selected: {len(fileSelect['selected'])} of {len(fileSelect['files'])} | {self.botHelper.getHelper.readableSize(selectedSize)}\n" \
+               f"Page: {fileSelect['page'] + 1} of {numPages}"
+
+    def fileSelectMarkup(self, uid: str) -> telegram.InlineKeyboardMarkup:
+        fileSelect = self.fileSelects[uid]
+        pageStart = fileSelect['page'] * self.fileSelectPageSize
+        buttonRows: typing.List[typing.List[telegram.InlineKeyboardButton]] = []
+        for fileIndex, filePath, fileSize in fileSelect['files'][pageStart:pageStart + self.fileSelectPageSize]:
+            buttonTxt = f"{('✅' if fileIndex in fileSelect['selected'] else '⬜')} [{self.botHelper.getHelper.readableSize(fileSize)}] {filePath}"
+            buttonRows.append([telegram.InlineKeyboardButton(text=buttonTxt, callback_data=f'fileSelect|{uid}|{fileIndex}')])
+        buttonRows.append([telegram.InlineKeyboardButton(text=buttonTxt, callback_data=f'fileSelect|{uid}|{buttonData}')
+                           for buttonTxt, buttonData in [('<', 'prev'), ('All', 'all'), ('None', 'none'), ('>', 'next')]])
+        buttonRows.append([telegram.InlineKeyboardButton(text='Done', callback_data=f'fileSelect|{uid}|done')])
+        return telegram.InlineKeyboardMarkup(buttonRows)
+
+    def fileSelectCallBack(self, update: telegram.Update, _: telegram.ext.CallbackContext) -> None:
+        query = update.callback_query
+        _, uid, queryData = query.data.split('|')
+        if not self.fileSelects.get(uid) or self.fileSelects[uid].get('isFinished'):
+            query.answer(text='File Selection Expired !')
+            return
+        mirrorInfo = self.botHelper.mirrorHelper.mirrorInfos[uid]
+        if query.from_user.id != mirrorInfo.msg.from_user.id:
+            query.answer(text='Not Your Mirror !')
+            return
+        fileSelect = self.fileSelects[uid]
+        numPages = ((len(fileSelect['files']) - 1) // self.fileSelectPageSize) + 1
+        if queryData == 'done':
+            if not fileSelect['selected']:
+                query.answer(text='Select at Least One File !')
+                return
+            if not self.fileSelectFinish(uid):
+                query.answer(text='File Selection Expired !')
+                return
+            query.answer()
+            query.edit_message_text(text=f"<code>{uid}</code> | Selected {len(fileSelect['selected'])} of {len(fileSelect['files'])} Files !",
+                                    parse_mode='HTML')
+            return
+        with self.fileSelectLock:
+            # a selection already passed to aria2 must not change under it
+            if fileSelect['isFinished']:
+                query.answer(text='File Selection Expired !')
+                return
+            if queryData == 'prev':
+                fileSelect['page'] = (fileSelect['page'] - 1) % numPages
+            elif queryData == 'next':
+                fileSelect['page'] = (fileSelect['page'] + 1) % numPages
+            elif queryData == 'all':
+                fileSelect['selected'] = set(dlFile[0] for dlFile in fileSelect['files'])
+            elif queryData == 'none':
+                fileSelect['selected'] = set()
+            else:
+                fileSelect['selected'] ^= {int(queryData)}
+        query.answer()
+        query.edit_message_text(text=self.fileSelectTxt(uid), parse_mode='HTML', reply_markup=self.fileSelectMarkup(uid))
+
+    def fileSelectFinish(self, uid: str, isSelectAll: bool = False) -> bool:
+        with self.fileSelectLock:
+            fileSelect = self.fileSelects.get(uid)
+            if not fileSelect or fileSelect['isFinished']:
+                return False
+            if isSelectAll:
+                # fallback of fileSelectExpire(), applied only if the user has not finished the selection first
+                fileSelect['selected'] = set(dlFile[0] for dlFile in fileSelect['files'])
+            fileSelect['isFinished'] = True
+        fileSelect['timer'].cancel()
+        selectedIndexes = ','.join([str(fileIndex) for fileIndex in sorted(fileSelect['selected'])])
+        self.api.client.change_option(self.gids[uid], {'select-file': selectedIndexes})
+        self.api.client.unpause(self.gids[uid])
+        selectedSize = sum([dlFile[2] for dlFile in fileSelect['files'] if dlFile[0] in fileSelect['selected']])
+        self.botHelper.mirrorHelper.mirrorInfos[uid].updateVars({MirrorInfo.updatableVars[0]: selectedSize})
+        self.logger.info(f"{uid} : Selected Files - [{selectedIndexes}]")
+        return True
+
+    def fileSelectExpire(self, uid: str) -> None:
+        fileSelect = self.fileSelects.get(uid)
+        if not fileSelect:
+            return
+        if not self.fileSelectFinish(uid, isSelectAll=True):
+            return
+        self.logger.info(f'{uid} : File Selection Timed Out')
+        try:
+            self.botHelper.bot.editMessageText(text=f"<code>{uid}</code> | File Selection Timed Out, Downloading All {len(fileSelect['files'])} Files !",
+                                               parse_mode='HTML', chat_id=self.botHelper.mirrorHelper.mirrorInfos[uid].chatId,
+                                               message_id=fileSelect['msgId'])
+        except telegram.error.TelegramError:
+            self.logger.warning(f'{uid} : Unable to Edit File Selection Message !')
+
+    def fileSelectCleanup(self, uid: str) -> None:
+        # pieces overlapping unselected files may still be written to disk by aria2
+        fileSelect = self.fileSelects.pop(uid)
+        if fileSelect.get('timer'):
+            fileSelect['timer'].cancel()
+        mirrorPath = self.botHelper.mirrorHelper.mirrorInfos[uid].path
+        for fileIndex, filePath, _ in fileSelect.get('files', []):
+            if fileIndex not in fileSelect['selected'] and os.path.isfile(os.path.join(mirrorPath, filePath)):
+                os.remove(os.path.join(mirrorPath, filePath))
+        for path, dirs, files in os.walk(mirrorPath, topdown=False):
+            if path != mirrorPath and not os.listdir(path):
+                os.rmdir(path)
 
     def getUid(self, gid: str) -> str:
         for uid in self.gids.keys():
@@ -1208,11 +1413,20 @@ class AriaHelper(BaseHelper):
 
     def startListener(self) -> None:
         self.api.listen_to_notifications(threaded=True,
-                                         on_download_start=self.onDownloadStart,
-                                         on_download_pause=self.onDownloadPause,
-                                         on_download_complete=self.onDownloadComplete,
-                                         on_download_stop=self.onDownloadStop,
-                                         on_download_error=self.onDownloadError)
+                                         on_download_start=self.guardCallBack(self.onDownloadStart),
+                                         on_download_pause=self.guardCallBack(self.onDownloadPause),
+                                         on_download_complete=self.guardCallBack(self.onDownloadComplete),
+                                         on_download_stop=self.guardCallBack(self.onDownloadStop),
+                                         on_download_error=self.guardCallBack(self.onDownloadError))
+
+    def guardCallBack(self, callBack: typing.Callable[[aria2p.API, str], None]) -> typing.Callable[[aria2p.API, str], None]:
+        # aria2p runs the callbacks inline, an exception escaping one of them would end the listener thread
+        def guardedCallBack(api: aria2p.API, gid: str) -> None:
+            try:
+                callBack(api, gid)
+            except Exception:
+                self.logger.exception(f'Notification Callback Failed: {callBack.__name__} (gid {gid})')
+        return guardedCallBack
 
     def updateProgress(self, uid: str) -> None:
         if uid in self.gids.keys():
@@ -1229,22 +1443,39 @@ class AriaHelper(BaseHelper):
             self.botHelper.mirrorHelper.mirrorInfos[uid].updateVars(currVars)
 
     def onDownloadStart(self, _: aria2p.API, gid: str) -> None:
+        if not self.getUid(gid):
+            return
         self.logger.debug(vars(self.getDlObj(gid)))
 
     def onDownloadPause(self, _: aria2p.API, gid: str) -> None:
+        if not self.getUid(gid):
+            return
         self.logger.debug(vars(self.getDlObj(gid)))
 
     def onDownloadComplete(self, _: aria2p.API, gid: str) -> None:
+        uid = self.getUid(gid)
+        if not uid:
+            # downloads added by other helpers (trackers list, youtube-dl formats) are tracked by their owners,
+            # their results may already be removed, so no rpc is made for them
+            return
         self.logger.debug(vars(self.getDlObj(gid)))
         if self.getDlObj(gid).followed_by_ids:
-            self.gids[self.getUid(gid)] = self.getDlObj(gid).followed_by_ids[0]
+            self.gids[uid] = self.getDlObj(gid).followed_by_ids[0]
+            if uid in self.fileSelects:
+                self.fileSelectStart(uid)
             return
-        self.botHelper.mirrorListenerHelper.updateStatus(self.getUid(gid), MirrorStatus.downloadComplete)
+        if uid in self.fileSelects:
+            self.fileSelectCleanup(uid)
+        self.botHelper.mirrorListenerHelper.updateStatus(uid, MirrorStatus.downloadComplete)
 
     def onDownloadStop(self, _: aria2p.API, gid: str) -> None:
+        if not self.getUid(gid):
+            return
         self.logger.debug(vars(self.getDlObj(gid)))
 
     def onDownloadError(self, _: aria2p.API, gid: str) -> None:
+        if not self.getUid(gid):
+            return
         self.logger.debug(vars(self.getDlObj(gid)))
 
 
@@ -1304,10 +1535,54 @@ class GoogleDriveHelper(BaseHelper):
             currVars = {MirrorInfo.updatableVars[0]: self.botHelper.getHelper.folderSize(mirrorInfo.path)}
             self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].updateVars(currVars)
             uploadPath = os.path.join(mirrorInfo.path, os.listdir(mirrorInfo.path)[0])
-            if os.path.isdir(uploadPath):
+            if mirrorInfo.isCompress and mirrorInfo.isStreamArchive:
+                # the source size is the known total, so progress counts the source bytes the stream has consumed
+                archiveStream = self.botHelper.compressionHelper.openArchiveStream(
+                    uploadPath, mirrorInfo.compressionEngine, ByteProgress(mirrorInfo, currVars[MirrorInfo.updatableVars[0]],
+                                                                           self.botHelper.statusHelper.statusUpdateInterval))
+                try:
+                    fileId = self.uploadStream(archiveStream, parentFolderId=mirrorInfo.googleDriveUploadFolderId, uid=mirrorInfo.uid)
+                except (OSError, googleapiclient.errors.HttpError):
+                    self.logger.exception(f'{mirrorInfo.uid} : Stream Upload Failed !')
+                    archiveStream.abort()
+                    self.botHelper.bot.sendMessage(text='Upload Failed !', parse_mode='HTML',
+                                                   chat_id=mirrorInfo.chatId, reply_to_message_id=mirrorInfo.msgId)
+                    self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.uploadError)
+                    return
+                self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].uploadUrl = self.baseFileDownloadUrl.format(fileId)
+            elif mirrorInfo.isCompress and self.botHelper.mirrorListenerHelper.isPipedVolumes(mirrorInfo):
+                uploadIds: typing.Dict[str, str] = {}
+                try:
+                    archiveStream = self.botHelper.compressionHelper.openArchiveStream(
+                        uploadPath, mirrorInfo.compressionEngine, ByteProgress(mirrorInfo, currVars[MirrorInfo.updatableVars[0]],
+                                                                               self.botHelper.statusHelper.statusUpdateInterval))
+                    self.uploadVolumes(archiveStream, mirrorInfo.path, self.botHelper.compressionHelper.getVolumeSize(mirrorInfo),
+                                       parentFolderId=mirrorInfo.googleDriveUploadFolderId, uploadIds=uploadIds)
+                except (OSError, googleapiclient.errors.HttpError):
+                    self.logger.exception(f'{mirrorInfo.uid} : Volume Upload Failed !')
+                    self.botHelper.bot.sendMessage(text='Upload Failed !', parse_mode='HTML',
+                                                   chat_id=mirrorInfo.chatId, reply_to_message_id=mirrorInfo.msgId)
+                    self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.uploadError)
+                    return
+                self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].uploadUrl = \
+                    (self.baseFolderDownloadUrl.format(uploadIds['folderId']) if 'folderId' in uploadIds.keys()
+                     else self.baseFileDownloadUrl.format(uploadIds['fileId']))
+            elif mirrorInfo.isDecompress and mirrorInfo.isStreamArchive:
+                self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].updateVars(
+                    {MirrorInfo.updatableVars[0]: self.botHelper.decompressionHelper.getStreamSize(uploadPath)})
+                try:
+                    folderId = self.uploadArchiveMembers(uploadPath, parentFolderId=mirrorInfo.googleDriveUploadFolderId, uid=mirrorInfo.uid)
+                except (OSError, tarfile.TarError, zipfile.BadZipFile, googleapiclient.errors.HttpError):
+                    self.logger.exception(f'{mirrorInfo.uid} : Stream Upload Failed !')
+                    self.botHelper.bot.sendMessage(text='Upload Failed !', parse_mode='HTML',
+                                                   chat_id=mirrorInfo.chatId, reply_to_message_id=mirrorInfo.msgId)
+                    self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.uploadError)
+                    return
+                self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].uploadUrl = self.baseFolderDownloadUrl.format(folderId)
+            elif os.path.isdir(uploadPath):
                 folderId = self.uploadFolder(folderPath=uploadPath, parentFolderId=mirrorInfo.googleDriveUploadFolderId, uid=mirrorInfo.uid)
                 self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].uploadUrl = self.baseFolderDownloadUrl.format(folderId)
-            if os.path.isfile(uploadPath):
+            elif os.path.isfile(uploadPath):
                 fileId = self.uploadFile(filePath=uploadPath, parentFolderId=mirrorInfo.googleDriveUploadFolderId, uid=mirrorInfo.uid)
                 self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].uploadUrl = self.baseFileDownloadUrl.format(fileId)
         else:
@@ -1338,7 +1613,7 @@ class GoogleDriveHelper(BaseHelper):
         self.service = googleapiclient.discovery.build(serviceName='drive', version='v3', credentials=self.oauthCreds,
                                                        cache_discovery=False)
 
-    def uploadFile(self, filePath: str, parentFolderId: str, uid: str) -> str:
+    def uploadFile(self, filePath: str, parentFolderId: str, uid: str, isCountProgress: bool = True) -> str:
         upStatus: googleapiclient.http.MediaUploadProgress
         fileName, fileMimeType, fileMetadata, mediaBody = self.getUpData(filePath, isResumable=True)
         fileMetadata['parents'] = [parentFolderId]
@@ -1347,9 +1622,85 @@ class GoogleDriveHelper(BaseHelper):
         while not upResponse:
             upStatus, upResponse = fileOp.next_chunk()
             sizeUpdate = (self.chunkSize if not upResponse else (os.path.getsize(filePath) % self.chunkSize))
-            self.updateProgress(sizeUpdate, uid)
+            if isCountProgress:
+                self.updateProgress(sizeUpdate, uid)
+        return upResponse['id']
+
+    def uploadStream(self, archiveStream: 'ArchiveStream', parentFolderId: str, uid: str) -> str:
+        fileMetadata = {'name': archiveStream.archiveName, 'parents': [parentFolderId]}
+        mediaBody = StreamMediaUpload(archiveStream, 'application/octet-stream', self.chunkSize)
+        fileOp = self.service.files().create(supportsAllDrives=True, body=fileMetadata, media_body=mediaBody)
+        upResponse = None
+        # progress is counted from the source side by the archive stream's ByteProgress
+        while not upResponse:
+            upStatus, upResponse = fileOp.next_chunk()
+        try:
+            archiveStream.close()
+        except OSError:
+            # the stream ended early, what was uploaded is a truncated archive
+            self.service.files().delete(fileId=upResponse['id'], supportsAllDrives=True).execute()
+            raise
         return upResponse['id']
 
+    def uploadArchiveMembers(self, archivePath: str, parentFolderId: str, uid: str) -> str:
+        memberDir = self.botHelper.decompressionHelper.getArchiveSets(archivePath)[0]['folderPath']
+        folderIds: typing.Dict[str, str] = {'': self.createFolder(os.path.basename(memberDir), parentFolderId)}
+        folderLock = threading.Lock()
+        # one upload at a time, the shared drive service is not thread-safe; extraction still runs ahead of it
+        self.botHelper.decompressionHelper.streamExtract(
+            archivePath, lambda memberPath, memberName: self.uploadFile(filePath=memberPath, uid=uid,
+                                                                         parentFolderId=self.getMemberFolderId(os.path.dirname(memberName),
+                                                                                                               folderIds, folderLock)),
+            uploadWorkers=1)
+        return folderIds['']
+
+    def uploadVolumes(self, archiveStream: 'ArchiveStream', partDir: str, volumeSize: int, parentFolderId: str,
+                      uploadIds: typing.Dict[str, str]) -> None:
+        # one upload worker, the shared drive service is not thread-safe; compression still runs ahead of it
+        partPipeline = PartPipeline(lambda partPath, _: self.uploadVolume(partPath, archiveStream.archiveName, parentFolderId, uploadIds),
+                                    self.botHelper.telegramHelper.splitPartsOnDisk, name=f'{archiveStream.archiveName}-uploadVolumes')
+        try:
+            self.botHelper.compressionHelper.writeStreamParts(archiveStream, partDir, volumeSize, partPipeline)
+            partPipeline.finish()
+            archiveStream.close()
+        except BaseException:
+            partPipeline.abort()
+            archiveStream.abort()
+            for partName in os.listdir(partDir):
+                if partName.startswith(archiveStream.archiveName):
+                    os.remove(os.path.join(partDir, partName))
+            raise
+        if len(partPipeline.partPaths) > 1:
+            # the rejoin manifest goes next to the volumes, as a text file
+            manifestPath = os.path.join(partDir, f'{archiveStream.archiveName}.txt')
+            with open(manifestPath, 'wt') as manifestFile:
+                manifestFile.write(self.botHelper.telegramHelper.splitManifestMsg(archiveStream.archiveName, archiveStream.bytesRead, volumeSize,
+                                                                                  partPipeline.partPaths, isHtml=False))
+            try:
+                self.uploadFile(filePath=manifestPath, parentFolderId=uploadIds['folderId'], uid='', isCountProgress=False)
+            finally:
+                os.remove(manifestPath)
+
+    def uploadVolume(self, volumePath: str, archiveName: str, parentFolderId: str, uploadIds: typing.Dict[str, str]) -> None:
+        # progress is counted from the source side by the archive stream's ByteProgress
+        if os.path.basename(volumePath) == archiveName:
+            # a single volume arrives as a plain archive, only a set of volumes gets its own folder
+            uploadIds['fileId'] = self.uploadFile(filePath=volumePath, parentFolderId=parentFolderId, uid='', isCountProgress=False)
+            return
+        if 'folderId' not in uploadIds.keys():
+            uploadIds['folderId'] = self.createFolder(archiveName, parentFolderId)
+        self.uploadFile(filePath=volumePath, parentFolderId=uploadIds['folderId'], uid='', isCountProgress=False)
+
+    def getMemberFolderId(self, memberDirName: str, folderIds: typing.Dict[str, str], folderLock: threading.Lock) -> str:
+        with folderLock:
+            return self.createMemberFolder(memberDirName, folderIds)
+
+    def createMemberFolder(self, memberDirName: str, folderIds: typing.Dict[str, str]) -> str:
+        if memberDirName not in folderIds:
+            parentFolderId = self.createMemberFolder(os.path.dirname(memberDirName), folderIds)
+            folderIds[memberDirName] = self.createFolder(os.path.basename(memberDirName), parentFolderId)
+        return folderIds[memberDirName]
+
     def uploadFolder(self, folderPath: str, parentFolderId: str, uid: str) -> str:
         folderName = folderPath.split('/')[-1]
         folderId = self.createFolder(folderName, parentFolderId)
@@ -1496,40 +1847,170 @@ class MegaHelper(BaseHelper):
     def initHelper(self) -> None:
         super().initHelper()
         self.apiListener = MegaApiListener(self)
-        self.apiWrapper = MegaApiWrapper(self)
-        self.dlNodes: typing.Dict[str, mega.MegaNode] = {}
+        self.uploadFolderPath: str = self.botHelper.configHelper.configVars[self.botHelper.configHelper.optVars[8]]
+        self.uploadLimit: int = int(self.botHelper.configHelper.configVars[self.botHelper.configHelper.optVars[9]])
+        self.sessionFile = 'mega.session'
+        self.cacheDir = 'megaCache'
+        self.overQuotaWaitTime: int = 60 * 60
+        megaAuth = self.botHelper.configHelper.configVars[self.botHelper.configHelper.optVars[4]]
+        megaAuthList = self.botHelper.configHelper.configVars[self.botHelper.configHelper.optVars[10]]
+        # first account is the primary one, uploads always go there
+        self.apiWrappers: typing.List[MegaApiWrapper] = \
+            [MegaApiWrapper(self, {**megaAuth, **authInfo}) for authInfo in [megaAuth, *megaAuthList] if authInfo.get('emailId')]
+        if not self.apiWrappers:
+            self.apiWrappers = [MegaApiWrapper(self, megaAuth)]
+        self.apiWrapper = self.apiWrappers[0]
+        self.wrapperLock = threading.Lock()
+        self.transferFutures: typing.Dict[str, typing.List[MegaTransferFuture]] = {}
+        self.authorizeEvent = threading.Event()
 
     def addListener(self) -> None:
-        self.apiWrapper.api.addListener(self.apiListener)
+        for apiWrapper in self.apiWrappers:
+            apiWrapper.api.addListener(self.apiListener)
 
     def authorizeApi(self) -> None:
+        timeStart = time.time()
         self.apiWrapper.login()
-        self.apiWrapper.whoami()
+        self.authorizeEvent.set()
+        self.logger.info(f'Mega API Authorized in {round(time.time() - timeStart, 2)}s !')
+        for apiWrapper in self.apiWrappers:
+            if apiWrapper is not self.apiWrapper:
+                apiWrapper.login()
+            apiWrapper.whoami()
+        self.logger.info(f'Mega API Pool Ready ({len([apiWrapper for apiWrapper in self.apiWrappers if apiWrapper.isLoggedIn])} '
+                         f'of {len(self.apiWrappers)} Accounts) !')
 
     def unauthorizeApi(self) -> None:
-        self.apiWrapper.logout()
+        # keeps the session valid for fastLogin() on the next start
+        for apiWrapper in self.apiWrappers:
+            if apiWrapper.isLoggedIn:
+                apiWrapper.localLogout()
 
     def addDownload(self, mirrorInfo: 'MirrorInfo') -> None:
-        if 'folder' in mirrorInfo.downloadUrl:
-            self.dlNodes[mirrorInfo.uid] = self.apiWrapper.getFolderNode(mirrorInfo.downloadUrl)
-        if 'file' in mirrorInfo.downloadUrl:
-            self.dlNodes[mirrorInfo.uid] = self.apiWrapper.getFileNode(mirrorInfo.downloadUrl)
-        self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].updateVars({MirrorInfo.updatableVars[0]: self.dlNodes[mirrorInfo.uid].getSize()})
-        self.apiWrapper.downloadNode(self.dlNodes[mirrorInfo.uid], mirrorInfo.path)
+        self.authorizeEvent.wait()
+        triedWrappers: typing.List[MegaApiWrapper] = []
+        while True:
+            apiWrapper = self.pickWrapper(triedWrappers)
+            if apiWrapper is None:
+                # every usable account is over its quota, the last attempt's error is reported below
+                break
+            dlNode: typing.Optional[mega.MegaNode] = None
+            if 'folder' in mirrorInfo.downloadUrl:
+                dlNode = apiWrapper.getFolderNode(mirrorInfo.downloadUrl)
+            if 'file' in mirrorInfo.downloadUrl:
+                dlNode = apiWrapper.getFileNode(mirrorInfo.downloadUrl)
+            if dlNode is None:
+                self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.downloadError)
+                return
+            self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].updateVars({MirrorInfo.updatableVars[0]: apiWrapper.api.getSize(dlNode)})
+            transferFuture = MegaTransferFuture(self, mirrorInfo.uid)
+            self.transferFutures[mirrorInfo.uid] = [transferFuture]
+            with self.wrapperLock:
+                apiWrapper.activeTransfers += 1
+            self.logger.debug(f'{mirrorInfo.uid} : Downloading with Mega Account ({apiWrapper.getMaskedEmailId()})')
+            apiWrapper.downloadNode(dlNode, mirrorInfo.path, transferFuture)
+            with self.wrapperLock:
+                apiWrapper.activeTransfers -= 1
+                apiWrapper.bytesTransferred += transferFuture.transferredBytes()
+            self.transferFutures.pop(mirrorInfo.uid)
+            self.botHelper.threadingHelper.initThread(target=apiWrapper.whoami, name=f'{mirrorInfo.uid}-MegaAccountDetails')
+            if not transferFuture.isOverQuota:
+                break
+            apiWrapper.overQuotaUntil = time.time() + (transferFuture.overQuotaWait if transferFuture.overQuotaWait > 0 else self.overQuotaWaitTime)
+            triedWrappers.append(apiWrapper)
+            self.logger.info(f'{mirrorInfo.uid} : Mega Account ({apiWrapper.getMaskedEmailId()}) Over Transfer Quota ! Switching Account...')
+            if len(triedWrappers) == len(self.apiWrappers):
+                break
+        if not transferFuture.isSuccess():
+            self.logger.error(f'{mirrorInfo.uid} : Mega Download Failed ({transferFuture.errorStr})')
+            self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.downloadError)
+            return
+        self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.downloadComplete)
+
+    def pickWrapper(self, excludeWrappers: typing.List['MegaApiWrapper']) -> typing.Optional['MegaApiWrapper']:
+        with self.wrapperLock:
+            apiWrappers = [apiWrapper for apiWrapper in self.apiWrappers
+                           if apiWrapper.isLoggedIn and apiWrapper not in excludeWrappers and apiWrapper.overQuotaUntil < time.time()]
+            if not apiWrappers:
+                # the primary account is the fallback, unless it is the one that just failed
+                return (self.apiWrapper if self.apiWrapper not in excludeWrappers else None)
+            # least busy account first, then the one with the most transfer quota left
+            return sorted(apiWrappers, key=lambda apiWrapper: (apiWrapper.activeTransfers, -apiWrapper.transferQuotaLeft()))[0]
+
+    def statsMsg(self) -> str:
+        statsMsg = ''
+        for apiWrapper in self.apiWrappers:
+            statsMsg += f'mega: {apiWrapper.getMaskedEmailId()} | ' \
+                        f"{('overQuota' if apiWrapper.overQuotaUntil > time.time() else ('active' if apiWrapper.isLoggedIn else 'inactive'))}\n" \
+                        f'Transfers: {apiWrapper.activeTransfers} | ' \
+                        f'Transferred: {self.botHelper.getHelper.readableSize(apiWrapper.bytesTransferred)} | ' \
+                        f'Quota: {self.botHelper.getHelper.readableSize(apiWrapper.transferUsed)} of ' \
+                        f"{(self.botHelper.getHelper.readableSize(apiWrapper.transferMax) if apiWrapper.transferMax else 'N/A')}\n"
+        return statsMsg
 
     def cancelDownload(self, uid: str) -> None:
         raise NotImplementedError
 
     def addUpload(self, mirrorInfo: 'MirrorInfo') -> None:
-        raise NotImplementedError
+        self.authorizeEvent.wait()
+        currVars = {MirrorInfo.updatableVars[0]: self.botHelper.getHelper.folderSize(mirrorInfo.path)}
+        self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].updateVars(currVars)
+        uploadPath = os.path.join(mirrorInfo.path, os.listdir(mirrorInfo.path)[0])
+        uploadNode: typing.Optional[mega.MegaNode] = None
+        parentNode = self.apiWrapper.getNodeByPath(self.uploadFolderPath)
+        self.transferFutures[mirrorInfo.uid] = []
+        if parentNode is not None:
+            if os.path.isdir(uploadPath):
+                uploadNode = self.uploadFolder(folderPath=uploadPath, parentNode=parentNode, uid=mirrorInfo.uid)
+            if os.path.isfile(uploadPath):
+                uploadNode = self.uploadFile(filePath=uploadPath, parentNode=parentNode, uid=mirrorInfo.uid)
+        self.transferFutures.pop(mirrorInfo.uid)
+        if uploadNode is None:
+            self.logger.error(f'{mirrorInfo.uid} : Mega Upload Failed !')
+            self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.uploadError)
+            return
+        self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].uploadUrl = self.apiWrapper.exportNode(uploadNode)
+        self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.uploadComplete)
 
     def cancelUpload(self, uid: str) -> None:
         raise NotImplementedError
 
-    def getUid(self, nodeName: str) -> str:
-        for uid in self.dlNodes.keys():
-            if nodeName == self.dlNodes[uid].getName():
-                return uid
+    def uploadFile(self, filePath: str, parentNode: mega.MegaNode, uid: str) -> typing.Optional[mega.MegaNode]:
+        transferFuture = MegaTransferFuture(self, uid)
+        self.transferFutures[uid].append(transferFuture)
+        self.apiWrapper.api.startUpload(filePath, parentNode, transferFuture)
+        transferFuture.wait()
+        return (self.apiWrapper.api.getNodeByHandle(transferFuture.nodeHandle) if transferFuture.isSuccess() else None)
+
+    def uploadFolder(self, folderPath: str, parentNode: mega.MegaNode, uid: str) -> typing.Optional[mega.MegaNode]:
+        folderNodes: typing.Dict[str, typing.Optional[mega.MegaNode]] = \
+            {folderPath: self.apiWrapper.createFolder(os.path.basename(folderPath), parentNode)}
+        # at most uploadLimit transfers are started at once, a slot is freed as each transfer finishes
+        uploadSemaphore = threading.BoundedSemaphore(self.uploadLimit)
+        for path, dirs, files in os.walk(folderPath):
+            if folderNodes[path] is None:
+                break
+            for dirName in dirs:
+                folderNodes[os.path.join(path, dirName)] = self.apiWrapper.createFolder(dirName, folderNodes[path])
+            for fileName in files:
+                uploadSemaphore.acquire()
+                transferFuture = MegaTransferFuture(self, uid, onFinish=uploadSemaphore.release)
+                self.transferFutures[uid].append(transferFuture)
+                self.apiWrapper.api.startUpload(os.path.join(path, fileName), folderNodes[path], transferFuture)
+        for transferFuture in self.transferFutures[uid]:
+            transferFuture.wait()
+        if None in folderNodes.values() or not all([transferFuture.isSuccess() for transferFuture in self.transferFutures[uid]]):
+            return None
+        return folderNodes[folderPath]
+
+    def updateProgress(self, uid: str) -> None:
+        if uid in self.transferFutures.keys() and uid in self.botHelper.mirrorHelper.mirrorInfos.keys():
+            transferFutures = self.transferFutures[uid]
+            currVars: typing.Dict[str, typing.Union[int, float, str]] = \
+                {MirrorInfo.updatableVars[1]: sum([transferFuture.transferredBytes() for transferFuture in transferFutures]),
+                 MirrorInfo.updatableVars[2]: sum([transferFuture.speed() for transferFuture in transferFutures]),
+                 MirrorInfo.updatableVars[3]: time.time()}
+            self.botHelper.mirrorHelper.mirrorInfos[uid].updateVars(currVars)
 
 
 class TelegramHelper(BaseHelper):
@@ -1539,44 +2020,171 @@ class TelegramHelper(BaseHelper):
     def initHelper(self) -> None:
         super().initHelper()
         self.apiServerPid: int = 0
+        self.apiServerPort: int = 8081
+        self.apiServerStartTime: float = 0.0
+        self.apiServerLogOffset: int = 0
+        self.apiServerReadyTimeout: int = 30
+        self.apiServerMaxRetries: int = 3
+        # verbosity level 0 is what telegram-bot-api logs right before it gives up
+        self.apiServerFatalRegex: str = r'^\[\s*0\]'
         self.apiServerStartCmd: typing.List[str] = \
             ['telegram-bot-api', '--local', '--verbosity=9',
              f'--api-id={self.botHelper.configHelper.configVars[self.botHelper.configHelper.reqVars[2]]}',
              f'--api-hash={self.botHelper.configHelper.configVars[self.botHelper.configHelper.reqVars[3]]}',
              f'--log={os.path.join(self.botHelper.envVars["currWorkDir"], self.botHelper.loggingHelper.logFiles[1])}']
         self.uploadMaxSize: int = 2 * 1024 * 1024 * 1024
+        self.splitPartSize: int = 2000 * 1024 * 1024
+        self.splitPartsOnDisk: int = 2
         self.maxTimeout: int = 24 * 60 * 60
+        self.uploadLimit: int = int(self.botHelper.configHelper.configVars[self.botHelper.configHelper.optVars[11]])
+        self.mediaGroupMaxSize: int = 10
+        self.chatBuckets: typing.Dict[typing.Tuple[int, int], TokenBucket] = {}
+        self.uploadBots: typing.List[TelegramUploadBot] = []
+        self.uploadBotsLock = threading.Lock()
+        self.chatBucketsLock = threading.Lock()
+        self.progressLock = threading.Lock()
+        self.fileIdCacheFile = 'telegramFileIds.json'
+        self.fileIdCacheMaxSize: int = 10000
+        self.fileIdCache: typing.OrderedDict[str, typing.Dict[str, typing.Any]] = collections.OrderedDict()
+        self.fileIdCacheLock = threading.Lock()
+        self.fileIdCacheSaveDelay: int = 30
+        self.fileIdCacheSaveTimer: typing.Optional[threading.Timer] = None
+        self.contentSampleSize: int = 1024 * 1024
+        self.hashExecutor = concurrent.futures.ThreadPoolExecutor(max_workers=self.uploadLimit, thread_name_prefix='TelegramHash')
+        self.fileIdCacheLoad()
+        self.downloadLimit: int = 4
+        self.copyChunkSize: int = 4 * 1024 * 1024
+        self.mediaGroupsMaxSize: int = 1000
+        self.mediaGroups: typing.OrderedDict[str, typing.List[telegram.Message]] = collections.OrderedDict()
+        self.mediaGroupsLock = threading.Lock()
+        self.mediaGroupHandler = telegram.ext.MessageHandler(filters=(telegram.ext.Filters.document | telegram.ext.Filters.audio |
+                                                                      telegram.ext.Filters.video),
+                                                             callback=self.mediaGroupCallBack, run_async=True)
 
     def apiServerStart(self) -> None:
         if self.botHelper.restartVars and self.botHelper.restartVars['botApiServerPid']:
             self.apiServerPid = self.botHelper.restartVars['botApiServerPid']
+            self.apiServerStartTime = time.time()
+            self.apiServerLogOffset = self.apiServerLogSize()
             self.logger.info(f'botApiServer Already Running (pid {self.apiServerPid}) !')
         if not self.apiServerPid:
-            self.apiServerPid = subprocess.Popen(self.apiServerStartCmd).pid
-            self.logger.info(f'botApiServer Started (pid {self.apiServerPid}) !')
+            self.apiServerLaunch()
+
+    def apiServerLaunch(self) -> None:
+        self.apiServerStartTime = time.time()
+        self.apiServerLogOffset = self.apiServerLogSize()
+        self.apiServerPid = subprocess.Popen(self.apiServerStartCmd).pid
+        self.logger.info(f'botApiServer Started (pid {self.apiServerPid}) !')
 
     def apiServerCheck(self) -> None:
-        conSuccess = False
-        while not conSuccess:
+        for attemptNum in range(1, self.apiServerMaxRetries + 1):
+            if self.apiServerWaitReady():
+                self.logger.info(f'botApiServer Ready in {time.time() - self.apiServerStartTime:.2f}s (attempt {attemptNum}) !')
+                return
+            if attemptNum < self.apiServerMaxRetries:
+                self.logger.warning(f'botApiServer Not Ready, Relaunching (attempt {attemptNum + 1}/{self.apiServerMaxRetries})...')
+                self.apiServerKill()
+                self.apiServerLaunch()
+        self.logger.critical(f'botApiServer Failed to Start After {self.apiServerMaxRetries} Attempts !')
+        raise RuntimeError('botApiServer Failed to Start !')
+
+    def apiServerWaitReady(self) -> bool:
+        timeDeadline = time.time() + self.apiServerReadyTimeout
+        waitTime: float = 0.01
+        while time.time() < timeDeadline:
+            if not self.isApiServerAlive():
+                self.logger.error(f'botApiServer Exited (pid {self.apiServerPid}) !')
+                return False
+            fatalLine = self.apiServerFatalLine()
+            if fatalLine:
+                self.logger.error(f'botApiServer Fatal Error: {fatalLine}')
+                return False
             try:
-                self.botHelper.bot.getMe()
-                conSuccess = True
-            except telegram.error.NetworkError:
-                time.sleep(0.1)
-                continue
+                socket.create_connection((self.botHelper.listenAddress, self.apiServerPort), timeout=1).close()
+                # the port opens before the bot is logged in, getMe() is only answered once it is
+                self.botHelper.bot.getMe(timeout=5)
+                return True
+            except (OSError, telegram.error.NetworkError):
+                time.sleep(waitTime)
+                waitTime = min(waitTime * 2, 1.0)
+        self.logger.error(f'botApiServer Not Ready After {self.apiServerReadyTimeout}s !')
+        return False
+
+    def isApiServerAlive(self) -> bool:
+        try:
+            return psutil.Process(self.apiServerPid).status() != psutil.STATUS_ZOMBIE
+        except psutil.NoSuchProcess:
+            return False
+
+    def apiServerKill(self) -> None:
+        try:
+            apiServerProc = psutil.Process(self.apiServerPid)
+            apiServerProc.kill()
+            apiServerProc.wait(timeout=5)
+        except (psutil.NoSuchProcess, psutil.TimeoutExpired):
+            pass
+
+    def apiServerLogSize(self) -> int:
+        apiServerLogPath = os.path.join(self.botHelper.envVars['currWorkDir'], self.botHelper.loggingHelper.logFiles[1])
+        return (os.path.getsize(apiServerLogPath) if os.path.exists(apiServerLogPath) else 0)
+
+    def apiServerFatalLine(self) -> typing.Optional[str]:
+        apiServerLogPath = os.path.join(self.botHelper.envVars['currWorkDir'], self.botHelper.loggingHelper.logFiles[1])
+        if not os.path.exists(apiServerLogPath):
+            return None
+        with open(apiServerLogPath, 'rb') as apiServerLog:
+            apiServerLog.seek(self.apiServerLogOffset)
+            logChunk = apiServerLog.read()
+        # only complete lines are consumed, a line still being written is read again on the next poll
+        logChunk = logChunk[:logChunk.rfind(b'\n') + 1]
+        self.apiServerLogOffset += len(logChunk)
+        for logLine in logChunk.decode('utf-8', errors='replace').splitlines():
+            if re.match(self.apiServerFatalRegex, logLine):
+                return logLine
+        return None
 
     def apiServerStop(self) -> None:
         os.kill(self.apiServerPid, signal.SIGTERM)
         self.logger.info(f"botApiServer terminated (pid {self.apiServerPid})")
 
+    def mediaGroupCallBack(self, update: telegram.Update, _: telegram.ext.CallbackContext) -> None:
+        # the bot api has no call to fetch the rest of a media group, so its messages are remembered as they arrive
+        msg = update.effective_message
+        if not msg or not msg.media_group_id:
+            return
+        with self.mediaGroupsLock:
+            self.mediaGroups.setdefault(msg.media_group_id, []).append(msg)
+            self.mediaGroups.move_to_end(msg.media_group_id)
+            while len(self.mediaGroups) > self.mediaGroupsMaxSize:
+                self.mediaGroups.popitem(last=False)
+
     def addDownload(self, mirrorInfo: 'MirrorInfo') -> None:
         replyTo = mirrorInfo.msg.reply_to_message
-        for media in [replyTo.document, replyTo.audio, replyTo.video]:
-            if media:
-                self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].updateVars({mirrorInfo.updatableVars[0]: media.file_size})
-                self.downloadMedia(media, mirrorInfo.path)
-                break
-        self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.downloadComplete)
+        replyMsgs: typing.List[telegram.Message] = [replyTo]
+        if replyTo.media_group_id:
+            with self.mediaGroupsLock:
+                replyMsgs = sorted(self.mediaGroups.get(replyTo.media_group_id, replyMsgs), key=lambda groupMsg: groupMsg.message_id)
+        medias = []
+        for replyMsg in replyMsgs:
+            for media in [replyMsg.document, replyMsg.audio, replyMsg.video]:
+                if media:
+                    medias.append(media)
+                    break
+        downloadPath = mirrorInfo.path
+        if len(medias) > 1:
+            # uploaders expect a single top-level entry, so a media group is kept together in one folder
+            downloadPath = os.path.join(mirrorInfo.path, replyTo.media_group_id)
+            os.mkdir(downloadPath)
+        self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].updateVars({mirrorInfo.updatableVars[0]: sum([media.file_size for media in medias])})
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.downloadLimit, thread_name_prefix=f'{mirrorInfo.uid}-TelegramDownload') as downloadExecutor:
+            downloadFutures = [downloadExecutor.submit(self.downloadMedia, media, downloadPath, mirrorInfo.uid) for media in medias]
+            dlResponse = all([downloadFuture.result() for downloadFuture in downloadFutures])
+        if dlResponse:
+            self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.downloadComplete)
+        if not dlResponse:
+            self.botHelper.bot.sendMessage(text='Download Failed !', parse_mode='HTML',
+                                           chat_id=mirrorInfo.chatId, reply_to_message_id=mirrorInfo.msgId)
+            self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.downloadError)
 
     def cancelDownload(self, uid: str) -> None:
         raise NotImplementedError
@@ -1586,14 +2194,28 @@ class TelegramHelper(BaseHelper):
         self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].updateVars(currVars)
         uploadPath = os.path.join(mirrorInfo.path, os.listdir(mirrorInfo.path)[0])
         upResponse: bool = True
-        if os.path.isfile(uploadPath):
-            if not self.uploadFile(uploadPath, mirrorInfo.chatId, mirrorInfo.msgId):
+        if mirrorInfo.isCompress and (mirrorInfo.isStreamArchive or self.botHelper.mirrorListenerHelper.isPipedVolumes(mirrorInfo)):
+            # volumes are the parts cut from the archive stream, so both settings upload the same way
+            archiveStream = self.botHelper.compressionHelper.openArchiveStream(
+                uploadPath, mirrorInfo.compressionEngine, ByteProgress(mirrorInfo, currVars[MirrorInfo.updatableVars[0]],
+                                                                       self.botHelper.statusHelper.statusUpdateInterval))
+            partSize = self.botHelper.compressionHelper.getVolumeSize(mirrorInfo)
+            if not self.uploadArchiveStream(archiveStream, mirrorInfo.path, partSize, mirrorInfo.chatId, mirrorInfo.msgId, mirrorInfo.uid):
                 upResponse = False
-                self.botHelper.bot.sendMessage(text='Files Larger Than 2GB Cannot Be Uploaded Yet !', parse_mode='HTML',
-                                               chat_id=mirrorInfo.chatId, reply_to_message_id=mirrorInfo.msgId)
-        if os.path.isdir(uploadPath):
-            if not self.uploadFolder(uploadPath, mirrorInfo.chatId, mirrorInfo.msgId):
+        elif mirrorInfo.isDecompress and mirrorInfo.isStreamArchive:
+            self.botHelper.mirrorHelper.mirrorInfos[mirrorInfo.uid].updateVars(
+                {MirrorInfo.updatableVars[0]: self.botHelper.decompressionHelper.getStreamSize(uploadPath)})
+            if not self.uploadArchiveMembers(uploadPath, mirrorInfo.chatId, mirrorInfo.msgId, mirrorInfo.uid):
                 upResponse = False
+        elif os.path.isfile(uploadPath):
+            if not self.uploadFile(uploadPath, mirrorInfo.chatId, mirrorInfo.msgId, mirrorInfo.uid):
+                upResponse = False
+        elif os.path.isdir(uploadPath):
+            if not self.uploadFolder(uploadPath, mirrorInfo.chatId, mirrorInfo.msgId, mirrorInfo.uid):
+                upResponse = False
+        if not upResponse:
+            self.botHelper.bot.sendMessage(text='Upload Failed !', parse_mode='HTML',
+                                           chat_id=mirrorInfo.chatId, reply_to_message_id=mirrorInfo.msgId)
         if upResponse:
             self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.uploadComplete)
         if not upResponse:
@@ -1602,36 +2224,387 @@ class TelegramHelper(BaseHelper):
     def cancelUpload(self, uid: str) -> None:
         raise NotImplementedError
 
-    def downloadMedia(self, media: typing.Union[telegram.Document, telegram.Audio, telegram.Video], mirrorInfoPath: str) -> None:
-        shutil.move(src=media.get_file(timeout=self.maxTimeout).file_path,
-                    dst=os.path.join(mirrorInfoPath, media.file_name))
+    def downloadMedia(self, media: typing.Union[telegram.Document, telegram.Audio, telegram.Video], downloadPath: str, uid: str) -> bool:
+        try:
+            srcPath = media.get_file(timeout=self.maxTimeout).file_path
+            dstPath = os.path.join(downloadPath, (media.file_name or media.file_unique_id))
+            if os.stat(srcPath).st_dev == os.stat(downloadPath).st_dev:
+                # same filesystem, the file is handed over without copying a single byte
+                try:
+                    os.rename(srcPath, dstPath)
+                except PermissionError:
+                    os.link(srcPath, dstPath)
+                self.updateProgress(os.path.getsize(dstPath), uid)
+            else:
+                self.copyFile(srcPath, dstPath, uid)
+                try:
+                    os.remove(srcPath)
+                except PermissionError:
+                    self.logger.warning(f"Unable to Remove '{srcPath}' From botApiServer Files !")
+        except (OSError, telegram.error.TelegramError):
+            self.logger.exception(f"Download Failed: '{media.file_name}'")
+            return False
+        return True
 
-    def uploadFile(self, filePath: str, chatId: int, msgId: int) -> bool:
-        if os.path.getsize(filePath) < self.uploadMaxSize:
-            self.botHelper.bot.sendDocument(document=f'file://{filePath}', filename=filePath.split('/')[-1],
-                                            chat_id=chatId, reply_to_message_id=msgId, timeout=self.maxTimeout)
+    def copyFile(self, srcPath: str, dstPath: str, uid: str) -> None:
+        with open(srcPath, 'rb') as srcFile, open(dstPath, 'wb') as dstFile:
+            fileChunk = srcFile.read(self.copyChunkSize)
+            while fileChunk:
+                dstFile.write(fileChunk)
+                self.updateProgress(len(fileChunk), uid)
+                fileChunk = srcFile.read(self.copyChunkSize)
+
+    def uploadFile(self, filePath: str, chatId: int, msgId: int, uid: str) -> bool:
+        contentKey = self.contentKey(filePath)
+        uploadBot = self.pickUploadBot(chatId, [contentKey])
+        try:
+            fileKey = self.fileIdCacheKey(uploadBot.bot, contentKey)
+            if self.uploadCachedFile(uploadBot.bot, filePath, fileKey, chatId, msgId, uid):
+                return True
+            # the full hash for the cache entry is read alongside the upload instead of before it
+            hashFuture = self.hashExecutor.submit(self.botHelper.getHelper.fileHash, filePath)
+            if os.path.getsize(filePath) >= self.uploadMaxSize:
+                return self.uploadSplitFile(uploadBot.bot, filePath, fileKey, hashFuture, chatId, msgId, uid)
+            try:
+                fileMsg = self.sendRequest(uploadBot.bot, chatId, 'sendDocument', document=f'file://{filePath}', filename=filePath.split('/')[-1],
+                                           reply_to_message_id=msgId, timeout=self.maxTimeout)
+            except telegram.error.TelegramError:
+                self.logger.exception(f"Upload Failed: '{filePath}'")
+                return False
+            self.fileIdCacheUpdate({fileKey: {'fileHash': hashFuture.result(), 'fileIds': [fileMsg.document.file_id]}})
+            self.updateProgress(os.path.getsize(filePath), uid)
             return True
-        return False
+        finally:
+            self.releaseUploadBot(uploadBot)
+
+    def uploadCachedFile(self, bot: telegram.Bot, filePath: str, fileKey: str, chatId: int, msgId: int, uid: str) -> bool:
+        fileIds = self.getCachedFileIds(fileKey, filePath)
+        if not fileIds:
+            return False
+        sentMsgIds: typing.List[int] = []
+        try:
+            for fileId in fileIds:
+                sentMsgIds.append(self.sendRequest(bot, chatId, 'sendDocument', document=fileId, reply_to_message_id=msgId).message_id)
+        except telegram.error.TelegramError:
+            self.logger.warning(f"Cached file_id Rejected, Uploading Again: '{filePath}'")
+            self.fileIdCachePop(fileKey)
+            # every part is uploaded again, the ones already resent would show up twice
+            for sentMsgId in sentMsgIds:
+                try:
+                    self.sendRequest(bot, chatId, 'deleteMessage', message_id=sentMsgId)
+                except telegram.error.TelegramError:
+                    self.logger.warning(f'Unable to Delete Resent Part (msgId {sentMsgId}) !')
+            return False
+        if len(fileIds) > 1:
+            fileSplitter = FileSplitter(filePath, self.splitPartSize)
+            self.sendSplitManifest(bot, chatId, msgId, fileSplitter.fileName, fileSplitter.fileSize, fileSplitter.partSize,
+                                   [fileSplitter.partPath(partIndex) for partIndex in range(fileSplitter.numParts)])
+        self.logger.info(f"Sent From file_id Cache: '{filePath}'")
+        self.updateProgress(os.path.getsize(filePath), uid)
+        return True
 
-    def uploadFolder(self, folderPath: str, chatId: int, msgId: int) -> bool:
-        folderContents = os.listdir(folderPath)
-        skippedContents: [str] = []
-        if len(folderContents) != 0:
-            for contentName in folderContents:
-                contentPath = os.path.join(folderPath, contentName)
-                if os.path.isdir(contentPath):
-                    self.uploadFolder(contentPath, chatId, msgId)
-                if os.path.isfile(contentPath):
-                    if not self.uploadFile(contentPath, chatId, msgId):
-                        skippedContents.append(contentPath)
-        if skippedContents:
-            skippedContentsMsg = 'Skipped Files Due to uploadMaxSize:\n'
-            for content in skippedContents:
-                skippedContentsMsg += f'{content}\n'
-            self.botHelper.bot.sendMessage(text=skippedContentsMsg, parse_mode='HTML',
-                                           chat_id=chatId, reply_to_message_id=msgId)
+    def uploadFileGroup(self, filePaths: typing.List[str], chatId: int, msgId: int, uid: str) -> bool:
+        if len(filePaths) == 1:
+            return self.uploadFile(filePaths[0], chatId, msgId, uid)
+        contentKeys = [self.contentKey(filePath) for filePath in filePaths]
+        uploadBot = self.pickUploadBot(chatId, contentKeys)
+        try:
+            fileKeys = [self.fileIdCacheKey(uploadBot.bot, contentKey) for contentKey in contentKeys]
+            hashFutures = [self.hashExecutor.submit(self.botHelper.getHelper.fileHash, filePath) for filePath in filePaths]
+            cachedFileIds = [self.getCachedFileIds(fileKey, filePath, hashFuture)
+                             for fileKey, filePath, hashFuture in zip(fileKeys, filePaths, hashFutures)]
+            try:
+                try:
+                    groupMsgs = self.sendRequest(uploadBot.bot, chatId, 'sendMediaGroup',
+                                                 media=[telegram.InputMediaDocument(fileIds[0] if fileIds else f'file://{filePath}')
+                                                        for filePath, fileIds in zip(filePaths, cachedFileIds)],
+                                                 reply_to_message_id=msgId, timeout=self.maxTimeout)
+                except telegram.error.BadRequest:
+                    if not any(cachedFileIds):
+                        raise
+                    self.logger.warning(f'Cached file_id Rejected, Uploading Again: {filePaths}')
+                    for fileKey in fileKeys:
+                        self.fileIdCachePop(fileKey)
+                    groupMsgs = self.sendRequest(uploadBot.bot, chatId, 'sendMediaGroup',
+                                                 media=[telegram.InputMediaDocument(f'file://{filePath}') for filePath in filePaths],
+                                                 reply_to_message_id=msgId, timeout=self.maxTimeout)
+            except telegram.error.TelegramError:
+                self.logger.exception(f'Upload Failed: {filePaths}')
+                return False
+            self.fileIdCacheUpdate({fileKey: {'fileHash': hashFuture.result(), 'fileIds': [groupMsg.document.file_id]}
+                                    for fileKey, hashFuture, groupMsg in zip(fileKeys, hashFutures, groupMsgs)})
+            self.updateProgress(sum([os.path.getsize(filePath) for filePath in filePaths]), uid)
+            return True
+        finally:
+            self.releaseUploadBot(uploadBot)
+
+    def uploadSplitFile(self, bot: telegram.Bot, filePath: str, fileKey: str, hashFuture: concurrent.futures.Future,
+                        chatId: int, msgId: int, uid: str) -> bool:
+        fileSplitter = FileSplitter(filePath, self.splitPartSize)
+        self.logger.info(f"Splitting '{fileSplitter.fileName}' into {fileSplitter.numParts} Parts...")
+        partFileIds: typing.List[str] = []
+        # one upload worker, the parts have to arrive in order; the next part is written while the current one uploads
+        partPipeline = PartPipeline(lambda partPath, _: self.uploadSplitPart(bot, partPath, chatId, msgId, uid, partFileIds),
+                                    self.splitPartsOnDisk, name=f'{fileSplitter.fileName}-uploadParts')
+        try:
+            for partIndex in range(fileSplitter.numParts):
+                partPipeline.reserve()
+                partPipeline.submit(fileSplitter.writePart(partIndex), fileSplitter.partPath(partIndex).split('/')[-1])
+            partPipeline.finish()
+        except (OSError, telegram.error.TelegramError):
+            self.logger.exception(f"Split Upload Failed: '{fileSplitter.fileName}'")
+            partPipeline.abort()
+            for partIndex in range(fileSplitter.numParts):
+                if os.path.exists(fileSplitter.partPath(partIndex)):
+                    os.remove(fileSplitter.partPath(partIndex))
+            return False
+        self.fileIdCacheUpdate({fileKey: {'fileHash': hashFuture.result(), 'fileIds': partFileIds}})
+        self.sendSplitManifest(bot, chatId, msgId, fileSplitter.fileName, fileSplitter.fileSize, fileSplitter.partSize, partPipeline.partPaths)
+        return True
+
+    def uploadSplitPart(self, bot: telegram.Bot, partPath: str, chatId: int, msgId: int, uid: str, partFileIds: typing.List[str]) -> None:
+        partFileIds.append(self.uploadPart(bot, partPath, chatId, msgId))
+        self.updateProgress(os.path.getsize(partPath), uid)
+
+    def uploadPart(self, bot: telegram.Bot, partPath: str, chatId: int, msgId: int) -> str:
+        # parts are temporary, they skip the file_id cache and its hashing
+        partMsg = self.sendRequest(bot, chatId, 'sendDocument', document=f'file://{partPath}', filename=partPath.split('/')[-1],
+                                   reply_to_message_id=msgId, timeout=self.maxTimeout)
+        return partMsg.document.file_id
+
+    def uploadArchiveMembers(self, archivePath: str, chatId: int, msgId: int, uid: str) -> bool:
+        try:
+            self.botHelper.decompressionHelper.streamExtract(
+                archivePath, lambda memberPath, memberName: self.uploadArchiveMember(memberPath, chatId, msgId, uid),
+                uploadWorkers=self.uploadLimit)
+        except (OSError, tarfile.TarError, zipfile.BadZipFile):
+            self.logger.exception(f"Stream Upload Failed: '{archivePath}'")
+            return False
         return True
 
+    def uploadArchiveMember(self, memberPath: str, chatId: int, msgId: int, uid: str) -> None:
+        if not self.uploadFile(memberPath, chatId, msgId, uid):
+            raise OSError(f"Upload Failed: '{memberPath}'")
+
+    def uploadArchiveStream(self, archiveStream: 'ArchiveStream', partDir: str, partSize: int, chatId: int, msgId: int, uid: str) -> bool:
+        uploadBot = self.pickUploadBot(chatId, [])
+        self.logger.info(f"{uid} : Streaming '{archiveStream.archiveName}' into Parts...")
+        try:
+            # progress is counted from the source side by the archive stream's ByteProgress
+            partPipeline = PartPipeline(lambda partPath, _: self.uploadPart(uploadBot.bot, partPath, chatId, msgId),
+                                        self.splitPartsOnDisk, name=f'{uid}-uploadParts')
+            try:
+                self.botHelper.compressionHelper.writeStreamParts(archiveStream, partDir, partSize, partPipeline)
+                partPipeline.finish()
+                archiveStream.close()
+                self.sendSplitManifest(uploadBot.bot, chatId, msgId, archiveStream.archiveName, archiveStream.bytesRead, partSize,
+                                       partPipeline.partPaths)
+            except (OSError, telegram.error.TelegramError):
+                self.logger.exception(f"Stream Upload Failed: '{archiveStream.archiveName}'")
+                partPipeline.abort()
+                archiveStream.abort()
+                for partName in os.listdir(partDir):
+                    if partName.startswith(archiveStream.archiveName):
+                        os.remove(os.path.join(partDir, partName))
+                return False
+            return True
+        finally:
+            # the manifest goes out from the same bot, it is released only after that
+            self.releaseUploadBot(uploadBot)
+
+    def sendSplitManifest(self, bot: telegram.Bot, chatId: int, msgId: int, fileName: str, fileSize: int, partSize: int,
+                          partPaths: typing.List[str]) -> None:
+        if len(partPaths) > 1:
+            self.sendRequest(bot, chatId, 'sendMessage', text=self.splitManifestMsg(fileName, fileSize, partSize, partPaths),
+                             parse_mode='HTML', reply_to_message_id=msgId)
+
+    def splitManifestMsg(self, fileName: str, fileSize: int, partSize: int, partPaths: typing.List[str], isHtml: bool = True) -> str:
+        # isHtml False gives the same manifest as plain text, for targets that store it as a file
+        codeTxt: typing.Callable[[str], str] = ((lambda txt: f'<code>{html.escape(txt)}</code>') if isHtml else (lambda txt: txt))
+        partNames = [partPath.split('/')[-1] for partPath in partPaths]
+        unixRejoinCmd = f"cat {' '.join([shlex.quote(partName) for partName in partNames])} > {shlex.quote(fileName)}"
+        windowsRejoinCmd = 'copy /b ' + ' + '.join(['"' + partName + '"' for partName in partNames]) + ' "' + fileName + '"'
+        manifestMsg = f'Split Upload: {codeTxt(fileName)} [{self.botHelper.getHelper.readableSize(fileSize)}]\n' \
+                      f'Parts: {len(partNames)} x {self.botHelper.getHelper.readableSize(partSize)}\n'
+        for partName in partNames:
+            manifestMsg += f'{codeTxt(partName)}\n'
+        manifestMsg += f'Rejoin (Linux / macOS): {codeTxt(unixRejoinCmd)}\n' \
+                       f'Rejoin (Windows): {codeTxt(windowsRejoinCmd)}'
+        return manifestMsg
+
+    def uploadFolder(self, folderPath: str, chatId: int, msgId: int, uid: str) -> bool:
+        filePaths: typing.List[str] = []
+        for path, dirs, files in os.walk(folderPath):
+            dirs.sort()
+            filePaths += [os.path.join(path, file) for file in sorted(files)]
+        # files below uploadMaxSize are batched into media groups, larger ones are split and sent on their own
+        fileGroups: typing.List[typing.List[str]] = []
+        splitFiles: typing.List[str] = []
+        fileGroupSize: int = 0
+        for filePath in filePaths:
+            fileSize = os.path.getsize(filePath)
+            if fileSize >= self.uploadMaxSize:
+                splitFiles.append(filePath)
+                continue
+            if not fileGroups or len(fileGroups[-1]) == self.mediaGroupMaxSize or fileGroupSize + fileSize > self.uploadMaxSize:
+                fileGroups.append([])
+                fileGroupSize = 0
+            fileGroups[-1].append(filePath)
+            fileGroupSize += fileSize
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.uploadLimit, thread_name_prefix=f'{uid}-TelegramUpload') as uploadExecutor:
+            uploadFutures = [uploadExecutor.submit(self.uploadFileGroup, fileGroup, chatId, msgId, uid) for fileGroup in fileGroups]
+            uploadFutures += [uploadExecutor.submit(self.uploadFile, filePath, chatId, msgId, uid) for filePath in splitFiles]
+            return all([uploadFuture.result() for uploadFuture in uploadFutures])
+
+    def initUploadBots(self) -> None:
+        self.uploadBots.append(TelegramUploadBot(self.botHelper.bot))
+        for botToken in self.botHelper.configHelper.configVars[self.botHelper.configHelper.optVars[12]]:
+            # each worker bot gets its own connection pool, the uploads of one never queue behind another's
+            workerBot = telegram.Bot(token=botToken, base_url=f'http://{self.botHelper.listenAddress}:{self.apiServerPort}/bot',
+                                     request=telegram.utils.request.Request(con_pool_size=(self.uploadLimit + 4)))
+            try:
+                self.logger.info(f'Worker Bot Added: @{workerBot.getMe().username}')
+            except telegram.error.TelegramError:
+                self.logger.exception(f'Worker Bot Failed: {botToken.split(":")[0]}')
+                continue
+            self.uploadBots.append(TelegramUploadBot(workerBot))
+
+    def pickUploadBot(self, chatId: int, contentKeys: typing.List[str]) -> 'TelegramUploadBot':
+        # worker bots have to be members of the chat, the main bot is always allowed so there is always a fallback
+        uploadBots = [uploadBot for uploadBot in self.uploadBots if self.isChatAccessible(uploadBot, chatId)]
+        with self.uploadBotsLock:
+            timeNow = time.monotonic()
+            uploadBot = min(uploadBots, key=lambda uploadBot: (self.getChatBucket(uploadBot.bot, chatId).pausedUntil > timeNow,
+                                                               not self.isFileIdCached(uploadBot.bot, contentKeys),
+                                                               uploadBot.activeUploads))
+            uploadBot.activeUploads += 1
+            return uploadBot
+
+    def releaseUploadBot(self, uploadBot: 'TelegramUploadBot') -> None:
+        with self.uploadBotsLock:
+            uploadBot.activeUploads -= 1
+
+    def isChatAccessible(self, uploadBot: 'TelegramUploadBot', chatId: int) -> bool:
+        if uploadBot.bot is self.botHelper.bot:
+            return True
+        if chatId not in uploadBot.chatAccess.keys():
+            try:
+                uploadBot.bot.getChat(chat_id=chatId)
+                uploadBot.chatAccess[chatId] = True
+            except telegram.error.TelegramError:
+                self.logger.warning(f'Worker Bot @{uploadBot.bot.username} Cannot Access Chat {chatId} !')
+                uploadBot.chatAccess[chatId] = False
+        return uploadBot.chatAccess[chatId]
+
+    def fileIdCacheLoad(self) -> None:
+        fileIdCachePath = os.path.join(self.botHelper.envVars['currWorkDir'], self.fileIdCacheFile)
+        if os.path.exists(fileIdCachePath):
+            try:
+                # entries from before full hashes were stored cannot be verified and are dropped
+                self.fileIdCache.update({fileKey: fileEntry for fileKey, fileEntry in self.botHelper.configHelper.jsonFileLoad(fileIdCachePath).items()
+                                         if isinstance(fileEntry, dict)})
+            except json.JSONDecodeError:
+                self.logger.warning(f"Ignoring Corrupt '{self.fileIdCacheFile}' !")
+
+    def contentKey(self, filePath: str) -> str:
+        # file_ids only depend on the content, so a repeat of the same bytes is sent without uploading them again,
+        # only the head and tail are read here and a hit is confirmed against the full hash in getCachedFileIds()
+        fileSize = os.path.getsize(filePath)
+        hashSum = hashlib.sha256()
+        with open(filePath, 'rb') as fileStream:
+            hashSum.update(fileStream.read(self.contentSampleSize))
+            if fileSize > self.contentSampleSize:
+                fileStream.seek(max(self.contentSampleSize, fileSize - self.contentSampleSize))
+                hashSum.update(fileStream.read(self.contentSampleSize))
+        return f'{hashSum.hexdigest()}:{fileSize}'
+
+    def getCachedFileIds(self, fileKey: str, filePath: str,
+                         hashFuture: typing.Optional[concurrent.futures.Future] = None) -> typing.Optional[typing.List[str]]:
+        fileEntry = self.fileIdCacheGet(fileKey)
+        if not fileEntry:
+            return None
+        fileHash = (hashFuture.result() if hashFuture else self.botHelper.getHelper.fileHash(filePath))
+        if fileHash != fileEntry['fileHash']:
+            self.logger.info(f"Cached file_id Belongs to Different Content: '{filePath}'")
+            return None
+        return fileEntry['fileIds']
+
+    @staticmethod
+    def fileIdCacheKey(bot: telegram.Bot, contentKey: str) -> str:
+        # file_ids are only valid for the bot which received them
+        return f'{bot.id}:{contentKey}'
+
+    def isFileIdCached(self, bot: telegram.Bot, contentKeys: typing.List[str]) -> bool:
+        with self.fileIdCacheLock:
+            return any([self.fileIdCacheKey(bot, contentKey) in self.fileIdCache.keys() for contentKey in contentKeys])
+
+    def fileIdCacheGet(self, fileKey: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        with self.fileIdCacheLock:
+            if fileKey not in self.fileIdCache.keys():
+                return None
+            self.fileIdCache.move_to_end(fileKey)
+            return self.fileIdCache[fileKey]
+
+    def fileIdCacheUpdate(self, fileEntries: typing.Dict[str, typing.Dict[str, typing.Any]]) -> None:
+        with self.fileIdCacheLock:
+            for fileKey in fileEntries.keys():
+                self.fileIdCache[fileKey] = fileEntries[fileKey]
+                self.fileIdCache.move_to_end(fileKey)
+            while len(self.fileIdCache) > self.fileIdCacheMaxSize:
+                self.fileIdCache.popitem(last=False)
+            self.fileIdCacheSchedule()
+
+    def fileIdCachePop(self, fileKey: str) -> None:
+        with self.fileIdCacheLock:
+            self.fileIdCache.pop(fileKey, None)
+            self.fileIdCacheSchedule()
+
+    def fileIdCacheSchedule(self) -> None:
+        # called with fileIdCacheLock held, a burst of uploads ends up in a single write of the cache file
+        if self.fileIdCacheSaveTimer:
+            return
+        self.fileIdCacheSaveTimer = threading.Timer(self.fileIdCacheSaveDelay, self.fileIdCacheSave)
+        self.fileIdCacheSaveTimer.daemon = True
+        self.fileIdCacheSaveTimer.start()
+
+    def fileIdCacheSave(self) -> None:
+        with self.fileIdCacheLock:
+            if self.fileIdCacheSaveTimer:
+                self.fileIdCacheSaveTimer.cancel()
+                self.fileIdCacheSaveTimer = None
+            self.botHelper.configHelper.jsonFileWrite(os.path.join(self.botHelper.envVars['currWorkDir'], self.fileIdCacheFile), self.fileIdCache)
+
+    def getChatBucket(self, bot: telegram.Bot, chatId: int) -> 'TokenBucket':
+        with self.chatBucketsLock:
+            # flood limits are counted per bot, so every bot has its own bucket for a chat
+            if (bot.id, chatId) not in self.chatBuckets.keys():
+                # telegram allows about one message per second in private chats and twenty per minute in groups
+                self.chatBuckets[(bot.id, chatId)] = (TokenBucket(rate=1.0, capacity=3) if chatId > 0 else TokenBucket(rate=(20 / 60), capacity=3))
+            return self.chatBuckets[(bot.id, chatId)]
+
+    def sendRequest(self, bot: telegram.Bot, chatId: int, requestName: str, **kwargs) -> typing.Any:
+        chatBucket = self.getChatBucket(bot, chatId)
+        while True:
+            chatBucket.acquire()
+            try:
+                return getattr(bot, requestName)(chat_id=chatId, **kwargs)
+            except telegram.error.RetryAfter as retryAfter:
+                self.logger.warning(f'Flood Wait: {retryAfter.retry_after}s (@{bot.username}, chatId {chatId})')
+                chatBucket.pause(retryAfter.retry_after)
+
+    def updateProgress(self, sizeUpdate: int, uid: str) -> None:
+        with self.progressLock:
+            sizeLast = self.botHelper.mirrorHelper.mirrorInfos[uid].sizeCurrent
+            timeLast = self.botHelper.mirrorHelper.mirrorInfos[uid].timeCurrent
+            speedLast = self.botHelper.mirrorHelper.mirrorInfos[uid].speedCurrent
+            sizeCurrent = sizeLast + sizeUpdate
+            timeCurrent = time.time()
+            timeDiff = timeCurrent - timeLast
+            speedCurrent = (int(sizeUpdate / timeDiff) if timeDiff else speedLast)
+            self.botHelper.mirrorHelper.mirrorInfos[uid].updateVars({MirrorInfo.updatableVars[1]: sizeCurrent,
+                                                                     MirrorInfo.updatableVars[2]: speedCurrent,
+                                                                     MirrorInfo.updatableVars[3]: timeCurrent})
+
 
 class YouTubeHelper(BaseHelper):
     def __init__(self, botHelper: BotHelper):
@@ -1639,31 +2612,261 @@ class YouTubeHelper(BaseHelper):
 
     def initHelper(self) -> None:
         super().initHelper()
+        self.downloadLimit: int = 4
+        # entries of one playlist in the shared pool at a time, other mirrors queue behind at most this many
+        self.jobDownloadLimit: int = 2
+        self.isAriaDownload: bool = (self.botHelper.configHelper.configVars[self.botHelper.configHelper.optVars[13]].lower() == 'true')
+        self.ariaPollInterval: float = 1.0
+        self.ariaFragmentLimit: int = 16
+        self.ariaDlOpts: typing.Dict[str, str] = {'max-connection-per-server': '16', 'split': '16', 'min-split-size': '1M'}
+        # worker threads live as long as the bot, each keeps one YoutubeDL and with it the extractors' player caches
+        self.threadLocal = threading.local()
+        self.downloadExecutor = concurrent.futures.ThreadPoolExecutor(max_workers=self.downloadLimit, thread_name_prefix='YouTubeDownload')
+        self.extractExecutor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='YouTubeExtract')
+        self.infoCache: typing.OrderedDict[str, typing.Tuple[float, dict]] = collections.OrderedDict()
+        self.infoCacheMaxSize: int = 256
+        self.infoCacheTtl: int = 30 * 60
+        self.infoExpireMargin: int = 5 * 60
+        self.extractFutures: typing.Dict[str, concurrent.futures.Future] = {}
+        self.infoCacheLock = threading.Lock()
 
     def addDownload(self, mirrorInfo: 'MirrorInfo') -> None:
-        ytdlOpts: dict = {'quiet': True, 'format': mirrorInfo.ytdlFormat, 'progress_hooks': [self.progressHook],
-                          'outtmpl': f'{mirrorInfo.path}/%(title)s-%(id)s.f%(format_id)s.%(ext)s'}
-        self.downloadVideo(mirrorInfo.downloadUrl, ytdlOpts)
+        ytdlOpts: dict = {'format': mirrorInfo.ytdlFormat, 'outtmpl': f'{mirrorInfo.path}/%(title)s-%(id)s.f%(format_id)s.%(ext)s'}
+        progressHook = YouTubeProgressHook(self.botHelper, mirrorInfo)
+        try:
+            # the playlist is only listed here, each entry is fully extracted by its own download
+            urlInfo = self.getInfo(mirrorInfo.downloadUrl)
+            if urlInfo.get('_type') in ['playlist', 'multi_video']:
+                dlResponse = self.downloadPlaylist(self.processInfo(urlInfo, {'extract_flat': 'in_playlist'}), ytdlOpts, progressHook)
+            else:
+                self.downloadExecutor.submit(self.downloadVideo, mirrorInfo.downloadUrl, ytdlOpts, progressHook).result()
+                dlResponse = True
+        except Exception:
+            # anything escaping here would leave the mirror stuck in the download queue
+            self.logger.exception(f'{mirrorInfo.uid} : Download Failed !')
+            dlResponse = False
+        if dlResponse:
+            progressHook.complete()
+        if not dlResponse:
+            self.botHelper.bot.sendMessage(text='Download Failed !', parse_mode='HTML',
+                                           chat_id=mirrorInfo.chatId, reply_to_message_id=mirrorInfo.msgId)
+            self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.downloadError)
 
     def cancelDownload(self, uid: str) -> None:
         raise NotImplementedError
 
-    @staticmethod
-    def downloadVideo(videoUrl: str, ytdlOpts: dict) -> None:
-        with youtube_dl.YoutubeDL(ytdlOpts) as ytdl:
-            ytdl.download([videoUrl])
+    def preExtract(self, videoUrl: str) -> None:
+        # started from /mirror, by the time the job reaches the download queue its info is usually cached
+        self.extractExecutor.submit(self.preExtractInfo, videoUrl)
 
-    def progressHook(self, progressUpdate: dict):
-        uid = progressUpdate['filename'].replace(self.botHelper.envVars['dlRootDirPath'], '').split('/')[1]
-        if progressUpdate['status'] == 'downloading':
-            currVars: typing.Dict[str, typing.Union[int, float, str]] = \
-                {MirrorInfo.updatableVars[0]: int((sizeTotal if (sizeTotal := progressUpdate['total_bytes']) else 0)),
-                 MirrorInfo.updatableVars[1]: int((sizeCurrent if (sizeCurrent := progressUpdate['downloaded_bytes']) else 0)),
-                 MirrorInfo.updatableVars[2]: int((speedCurrent if (speedCurrent := progressUpdate['speed']) else 0)),
-                 MirrorInfo.updatableVars[3]: time.time()}
-            self.botHelper.mirrorHelper.mirrorInfos[uid].updateVars(currVars)
-        if progressUpdate['status'] == 'finished':
-            self.botHelper.mirrorListenerHelper.updateStatus(uid, MirrorStatus.downloadComplete)
+    def preExtractInfo(self, videoUrl: str) -> None:
+        try:
+            urlInfo = self.getInfo(videoUrl)
+            if urlInfo.get('_type') in ['playlist', 'multi_video']:
+                playlistInfo = self.processInfo(urlInfo, {'extract_flat': 'in_playlist'})
+                for entry in [entry for entry in playlistInfo['entries'] if entry and entry.get('url')][:self.downloadLimit]:
+                    self.getInfo(entry['url'])
+        except youtube_dl.utils.DownloadError:
+            self.logger.debug(f"Pre-Extraction Failed: '{videoUrl}'")
+
+    def getYtdl(self) -> youtube_dl.YoutubeDL:
+        if not hasattr(self.threadLocal, 'ytdl'):
+            self.threadLocal.ytdl = youtube_dl.YoutubeDL({'quiet': True})
+            self.threadLocal.progressHooks = []
+            self.threadLocal.ytdl.add_progress_hook(self.threadProgressHook)
+        return self.threadLocal.ytdl
+
+    def threadProgressHook(self, progressUpdate: dict) -> None:
+        for progressHook in self.threadLocal.progressHooks:
+            progressHook(progressUpdate)
+
+    def getInfo(self, videoUrl: str) -> dict:
+        # the unprocessed extractor result is cached, format selection runs on a copy of it in processInfo()
+        cacheKey = self.infoCacheKey(videoUrl)
+        with self.infoCacheLock:
+            if cacheKey in self.infoCache.keys() and self.infoCache[cacheKey][0] > time.time():
+                self.infoCache.move_to_end(cacheKey)
+                return copy.deepcopy(self.infoCache[cacheKey][1])
+            extractFuture = self.extractFutures.get(cacheKey)
+            isExtractor = (extractFuture is None)
+            if isExtractor:
+                extractFuture = self.extractFutures[cacheKey] = concurrent.futures.Future()
+        if not isExtractor:
+            # the same url is already being extracted, e.g. by preExtract(), wait for that instead of repeating it
+            return copy.deepcopy(extractFuture.result())
+        try:
+            ytdl = self.getYtdl()
+            videoInfo = ytdl.extract_info(videoUrl, download=False, process=False)
+            while videoInfo.get('_type') == 'url':
+                # redirects are followed here, so a short link to a playlist is still seen as a playlist
+                videoInfo = ytdl.extract_info(videoInfo['url'], download=False, ie_key=videoInfo.get('ie_key'), process=False)
+            if 'entries' in videoInfo.keys() and not isinstance(videoInfo['entries'], list):
+                # lazily paged entries cannot be cached, they are listed once here
+                videoInfo['entries'] = (videoInfo['entries'].getslice() if isinstance(videoInfo['entries'], youtube_dl.utils.PagedList)
+                                        else list(videoInfo['entries']))
+        except Exception as extractError:
+            with self.infoCacheLock:
+                self.extractFutures.pop(cacheKey)
+            extractFuture.set_exception(extractError)
+            raise
+        with self.infoCacheLock:
+            self.infoCache[cacheKey] = (self.infoExpireTime(videoInfo), videoInfo)
+            while len(self.infoCache) > self.infoCacheMaxSize:
+                self.infoCache.popitem(last=False)
+            self.extractFutures.pop(cacheKey)
+        extractFuture.set_result(videoInfo)
+        return copy.deepcopy(videoInfo)
+
+    def processInfo(self, videoInfo: dict, ytdlOpts: dict) -> dict:
+        # format selection and playlist listing work on the cached extraction, nothing is extracted again
+        ytdl = self.getYtdl()
+        ytdl.params.update({'extract_flat': False, **ytdlOpts})
+        return ytdl.process_ie_result(videoInfo, download=False)
+
+    @staticmethod
+    def infoCacheKey(videoUrl: str) -> str:
+        # the matching extractor tells a video apart from a playlist on the same page, e.g. watch?v=X&list=Y
+        urlParts = urllib.parse.urlsplit(videoUrl.strip())
+        urlNetloc = urlParts.netloc.lower()
+        normalizedUrl = urllib.parse.urlunsplit((urlParts.scheme.lower(), (urlNetloc[4:] if urlNetloc.startswith('www.') else urlNetloc),
+                                                 urlParts.path.rstrip('/'),
+                                                 urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(urlParts.query))), ''))
+        for ieClass in youtube_dl.extractor.gen_extractor_classes():
+            if ieClass.suitable(videoUrl):
+                return f'{ieClass.ie_key()}:{normalizedUrl}'
+        return normalizedUrl
+
+    def infoExpireTime(self, videoInfo: dict) -> float:
+        # signed format urls stop working at their 'expire' timestamp, the cached info has to go before that
+        expireTimes = [int(expireMatch.group(1)) for formatInfo in (videoInfo.get('formats') or [videoInfo])
+                       if (expireMatch := re.search(r'[/?&]expire[/=](\d+)', formatInfo.get('url') or ''))]
+        if expireTimes:
+            return min(expireTimes) - self.infoExpireMargin
+        return time.time() + self.infoCacheTtl
+
+    def downloadPlaylist(self, playlistInfo: dict, ytdlOpts: dict, progressHook: 'YouTubeProgressHook') -> bool:
+        mirrorInfo = progressHook.mirrorInfo
+        entryUrls = [entry['url'] for entry in playlistInfo['entries'] if entry and entry.get('url')]
+        # uploaders expect a single top-level entry, so the whole playlist goes into one folder
+        playlistPath = os.path.join(mirrorInfo.path, youtube_dl.utils.sanitize_filename(playlistInfo.get('title') or playlistInfo['id']))
+        ytdlOpts = {**ytdlOpts, 'outtmpl': f'{playlistPath}/%(title)s-%(id)s.f%(format_id)s.%(ext)s'}
+        self.logger.info(f'{mirrorInfo.uid} : Downloading Playlist ({len(entryUrls)} Entries)...')
+        jobSemaphore = threading.BoundedSemaphore(self.jobDownloadLimit)
+        downloadFutures: typing.Dict[concurrent.futures.Future, str] = {}
+        for entryUrl in entryUrls:
+            jobSemaphore.acquire()
+            downloadFuture = self.downloadExecutor.submit(self.downloadVideo, entryUrl, ytdlOpts, progressHook)
+            downloadFuture.add_done_callback(lambda _: jobSemaphore.release())
+            downloadFutures[downloadFuture] = entryUrl
+        numFailed: int = 0
+        for downloadFuture in concurrent.futures.as_completed(downloadFutures):
+            try:
+                downloadFuture.result()
+            except Exception:
+                # an unavailable entry should not take the rest of the playlist down with it
+                self.logger.opt(exception=True).warning(f'{mirrorInfo.uid} : Skipped Playlist Entry: {downloadFutures[downloadFuture]}')
+                numFailed += 1
+        return numFailed < len(entryUrls)
+
+    def downloadVideo(self, videoUrl: str, ytdlOpts: dict, progressHook: 'YouTubeProgressHook') -> None:
+        videoInfo = self.processInfo(self.getInfo(videoUrl), ytdlOpts)
+        ytdl = self.getYtdl()
+        self.threadLocal.progressHooks = [progressHook]
+        filePath = ytdl.prepare_filename(videoInfo)
+        formatInfos = (videoInfo.get('requested_formats') or [videoInfo])
+        # same part names process_info() gives the formats before merging them
+        formatPaths = ([youtube_dl.utils.prepend_extension(ytdl.prepare_filename({**videoInfo, **formatInfo}), f'f{formatInfo["format_id"]}', formatInfo['ext'])
+                        for formatInfo in formatInfos] if len(formatInfos) > 1 else [filePath])
+        progressHook.addVideo(filePath, formatPaths)
+        try:
+            if not self.isAriaDownload or not all([formatInfo.get('protocol') in ['http', 'https', 'http_dash_segments'] for formatInfo in formatInfos]):
+                # info is already resolved, process_info() only downloads; hls and other streaming protocols always end up here
+                ytdl.process_info(videoInfo)
+            else:
+                self.downloadFormatsAria(filePath, formatInfos, formatPaths, progressHook)
+        finally:
+            self.threadLocal.progressHooks = []
+            # process_info() and downloadFormatsAria() both return only after the formats are merged
+            progressHook.videoDone(filePath)
+
+    def downloadFormatsAria(self, filePath: str, formatInfos: typing.List[dict], formatPaths: typing.List[str],
+                            progressHook: 'YouTubeProgressHook') -> None:
+        formatJobs: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        for formatInfo, formatPath in zip(formatInfos, formatPaths):
+            dlOpts = {**self.ariaDlOpts, 'dir': os.path.dirname(formatPath),
+                      'header': [f'{headerKey}: {headerVal}' for headerKey, headerVal in formatInfo.get('http_headers', {}).items()]}
+            if formatInfo['protocol'] == 'http_dash_segments':
+                # every fragment is a separate aria2 download, only ariaFragmentLimit of them are handed to the daemon at once
+                fragmentUrls = [(fragment.get('url') or urllib.parse.urljoin(formatInfo['fragment_base_url'], fragment['path']))
+                                for fragment in formatInfo['fragments']]
+                dlItems = [(fragmentUrl, f'{os.path.basename(formatPath)}.frag{fragmentIndex}') for fragmentIndex, fragmentUrl in enumerate(fragmentUrls)]
+            else:
+                dlItems = [(formatInfo['url'], os.path.basename(formatPath))]
+            formatJobs[formatPath] = {'dlOpts': dlOpts, 'pending': collections.deque(dlItems), 'numItems': len(dlItems),
+                                      'sizeTotal': (formatInfo.get('filesize') or formatInfo.get('filesize_approx') or 0), 'sizeDone': 0}
+        try:
+            self.waitAriaDownloads(formatJobs, progressHook)
+            for formatInfo, formatPath in zip(formatInfos, formatPaths):
+                if formatInfo['protocol'] == 'http_dash_segments':
+                    with open(formatPath, 'wb') as formatFile:
+                        for fragmentIndex in range(formatJobs[formatPath]['numItems']):
+                            with open(f'{formatPath}.frag{fragmentIndex}', 'rb') as fragmentFile:
+                                shutil.copyfileobj(fragmentFile, formatFile)
+                            os.remove(f'{formatPath}.frag{fragmentIndex}')
+        except BaseException:
+            # fragments, partial formats and their .aria2 control files all start with the format's file name
+            for formatPath in formatPaths:
+                for fileName in os.listdir(os.path.dirname(formatPath)):
+                    if fileName.startswith(os.path.basename(formatPath)):
+                        os.remove(os.path.join(os.path.dirname(formatPath), fileName))
+            raise
+        if len(formatPaths) > 1:
+            # same stream mapping youtube-dl's FFmpegMergerPP uses
+            mergeCmd = ['ffmpeg', '-y', '-loglevel', 'error']
+            for formatPath in formatPaths:
+                mergeCmd += ['-i', formatPath]
+            mergeCmd += ['-c', 'copy', '-map', '0:v:0', '-map', '1:a:0', filePath]
+            if subprocess.run(mergeCmd).returncode != 0:
+                raise youtube_dl.utils.DownloadError(f"Merging Formats Failed: '{filePath}'")
+            for formatPath in formatPaths:
+                os.remove(formatPath)
+
+    def waitAriaDownloads(self, formatJobs: typing.Dict[str, typing.Dict[str, typing.Any]], progressHook: 'YouTubeProgressHook') -> None:
+        # gid : formatPath, only downloads still running are polled
+        activeGids: typing.Dict[str, str] = {}
+        try:
+            while True:
+                for formatPath, formatJob in formatJobs.items():
+                    while formatJob['pending'] and len(activeGids) < self.ariaFragmentLimit:
+                        dlUrl, dlName = formatJob['pending'].popleft()
+                        activeGids[self.botHelper.ariaHelper.api.add_uris([dlUrl], options={**formatJob['dlOpts'], 'out': dlName}).gid] = formatPath
+                if not activeGids:
+                    return
+                time.sleep(self.ariaPollInterval)
+                dlObjs = self.botHelper.ariaHelper.api.get_downloads(list(activeGids.keys()))
+                activeSizes: typing.Dict[str, typing.List[int]] = {formatPath: [0, 0, 0] for formatPath in formatJobs.keys()}
+                for dlObj in dlObjs:
+                    if dlObj.has_failed:
+                        raise youtube_dl.utils.DownloadError(f'aria2 Download Failed: {dlObj.error_message}')
+                    if dlObj.is_complete:
+                        formatJobs[activeGids.pop(dlObj.gid)]['sizeDone'] += dlObj.completed_length
+                        self.botHelper.ariaHelper.api.client.remove_download_result(dlObj.gid)
+                        continue
+                    activeSizes[activeGids[dlObj.gid]][0] += dlObj.total_length
+                    activeSizes[activeGids[dlObj.gid]][1] += dlObj.completed_length
+                    activeSizes[activeGids[dlObj.gid]][2] += dlObj.download_speed
+                for formatPath, formatJob in formatJobs.items():
+                    numStarted = formatJob['numItems'] - len(formatJob['pending'])
+                    sizeKnown = formatJob['sizeDone'] + activeSizes[formatPath][0]
+                    # without a reported size, the fragments seen so far are extrapolated to all of them
+                    sizeTotal = (formatJob['sizeTotal'] or (sizeKnown * formatJob['numItems'] // numStarted if numStarted else 0))
+                    isFinished = (not formatJob['pending'] and formatPath not in activeGids.values())
+                    progressHook.updateFile(formatPath, {'sizeTotal': sizeTotal,
+                                                         'sizeCurrent': formatJob['sizeDone'] + activeSizes[formatPath][1],
+                                                         'speedCurrent': activeSizes[formatPath][2]}, isFinished)
+        finally:
+            if activeGids:
+                self.botHelper.ariaHelper.api.remove(self.botHelper.ariaHelper.api.get_downloads(list(activeGids.keys())), force=True, clean=True)
 
 
 class CompressionHelper(BaseHelper):
@@ -1672,23 +2875,200 @@ class CompressionHelper(BaseHelper):
 
     def initHelper(self) -> None:
         super().initHelper()
+        self.tarBufSize: int = 1024 * 1024
+        self.volumeSize: int = int(self.botHelper.configHelper.configVars[self.botHelper.configHelper.optVars[16]]) * 1024 * 1024
+        # engine : [compressor command reading a tar stream on stdin, archive extension]; no command means python does it
+        self.compressionEngines: typing.Dict[str, typing.List[typing.Union[typing.List[str], str, None]]] = \
+            {'zstd': [['zstd', '-T0', '-3', '-q', '-c'], '.tar.zst'],
+             'pigz': [['pigz', '-p', str(os.cpu_count()), '-c'], '.tar.gz'],
+             'xz': [['xz', '-T0', '-c'], '.tar.xz'],
+             'tar': [None, '.tar'],
+             'gzip': [None, '.tar.gz']}
+        # media and archives are already compressed, another pass only burns cpu
+        self.storeExtensions: typing.List[str] = ['.3gp', '.7z', '.aac', '.apk', '.avi', '.br', '.bz2', '.docx', '.epub', '.flac',
+                                                  '.flv', '.gif', '.gz', '.heic', '.iso', '.jar', '.jpeg', '.jpg', '.lz4', '.m4a',
+                                                  '.m4v', '.mkv', '.mov', '.mp3', '.mp4', '.mpg', '.ogg', '.opus', '.png', '.rar',
+                                                  '.ts', '.webm', '.webp', '.wmv', '.xlsx', '.xz', '.zip', '.zst']
+        self.sampleSize: int = 64 * 1024
+        self.sampleMinFileSize: int = 1024 * 1024
+        self.sampleEntropyLimit: float = 7.5
+        self.storeSizeRatio: float = 0.8
 
     def addCompression(self, mirrorInfo: 'MirrorInfo') -> None:
-        self.compressSource(os.path.join(mirrorInfo.path, os.listdir(mirrorInfo.path)[0]))
+        sourcePath = os.path.join(mirrorInfo.path, os.listdir(mirrorInfo.path)[0])
+        byteProgress = ByteProgress(mirrorInfo, self.botHelper.getHelper.pathSize(sourcePath),
+                                    self.botHelper.statusHelper.statusUpdateInterval)
+        try:
+            self.compressSource(sourcePath, mirrorInfo.compressionEngine, self.getVolumeSize(mirrorInfo), byteProgress)
+        except OSError:
+            self.logger.exception(f'{mirrorInfo.uid} : Compression Failed !')
+            self.botHelper.bot.sendMessage(text='Compression Failed !', parse_mode='HTML',
+                                           chat_id=mirrorInfo.chatId, reply_to_message_id=mirrorInfo.msgId)
+            self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.compressionError)
+            return
         self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.compressionComplete)
 
     def cancelCompression(self, uid: str) -> None:
         raise NotImplementedError
 
-    def compressSource(self, sourcePath: str) -> None:
-        archiveFormat = list(self.botHelper.mirrorHelper.supportedArchiveFormats.keys())[3]
-        sourceTempPath = sourcePath + 'temp'
-        sourceName = sourcePath.split('/')[-1]
-        os.mkdir(sourceTempPath)
-        shutil.move(src=sourcePath, dst=os.path.join(sourceTempPath, sourceName))
-        shutil.move(src=sourceTempPath, dst=sourcePath)
-        shutil.make_archive(sourcePath, archiveFormat, sourcePath)
+    def getEngine(self, compressionEngine: str) -> str:
+        if compressionEngine not in self.compressionEngines.keys():
+            self.logger.warning(f"Unknown compressionEngine '{compressionEngine}', Using 'gzip' !")
+            return 'gzip'
+        compressCmd = self.compressionEngines[compressionEngine][0]
+        if compressCmd and not shutil.which(compressCmd[0]):
+            self.logger.warning(f"'{compressCmd[0]}' Not Found, Using 'gzip' !")
+            return 'gzip'
+        return compressionEngine
+
+    def getVolumeSize(self, mirrorInfo: 'MirrorInfo') -> int:
+        # 0 means a single archive; compressionVolumeSize may only lower the limit of the upload target
+        if mirrorInfo.isTelegramUpload:
+            return min(self.volumeSize, self.botHelper.telegramHelper.splitPartSize) if self.volumeSize \
+                else self.botHelper.telegramHelper.splitPartSize
+        return self.volumeSize
+
+    def isStoreSource(self, sourcePath: str) -> bool:
+        filePaths = [sourcePath] if os.path.isfile(sourcePath) else \
+            [os.path.join(path, file) for path, dirs, files in os.walk(sourcePath) for file in files]
+        sizeTotal, sizeStore = 0, 0
+        for filePath in filePaths:
+            if os.path.islink(filePath):
+                continue
+            fileSize = os.path.getsize(filePath)
+            sizeTotal += fileSize
+            if self.isStoreFile(filePath, fileSize):
+                sizeStore += fileSize
+        # weighed by size, a few text files next to a large video do not change the outcome
+        return sizeTotal != 0 and sizeStore >= sizeTotal * self.storeSizeRatio
+
+    def isStoreFile(self, filePath: str, fileSize: int) -> bool:
+        if os.path.splitext(filePath)[1].lower() in self.storeExtensions:
+            return True
+        if fileSize < self.sampleMinFileSize:
+            return False
+        # samples from the start and the middle, headers alone can look compressible
+        with open(filePath, 'rb') as sampleFile:
+            sampleData = sampleFile.read(self.sampleSize)
+            sampleFile.seek(fileSize // 2)
+            sampleData += sampleFile.read(self.sampleSize)
+        return self.byteEntropy(sampleData) >= self.sampleEntropyLimit
+
+    @staticmethod
+    def byteEntropy(data: bytes) -> float:
+        return -sum([(byteCount / len(data)) * math.log2(byteCount / len(data)) for byteCount in collections.Counter(data).values()])
+
+    def getStoreEngine(self, sourcePath: str, compressionEngine: str) -> str:
+        if compressionEngine != 'tar' and self.isStoreSource(sourcePath):
+            self.logger.info(f"Source Is Mostly Incompressible, Storing As Plain Tar: '{sourcePath}'")
+            return 'tar'
+        return compressionEngine
+
+    def compressSource(self, sourcePath: str, compressionEngine: str, volumeSize: int = 0,
+                       byteProgress: typing.Optional['ByteProgress'] = None) -> str:
+        compressionEngine = self.getStoreEngine(sourcePath, self.getEngine(compressionEngine))
+        compressCmd, archiveExt = self.compressionEngines[compressionEngine]
+        archivePath = sourcePath + archiveExt
+        if volumeSize:
+            archivePath = self.compressVolumes(sourcePath, compressionEngine, volumeSize, byteProgress)
+            shutil.rmtree(sourcePath) if os.path.isdir(sourcePath) else os.remove(sourcePath)
+            return archivePath
+        with open(archivePath, 'wb') as archiveFile:
+            if not compressCmd:
+                self.writeTar(sourcePath, archiveFile, ('w|gz' if compressionEngine == 'gzip' else 'w|'), byteProgress)
+            else:
+                # tar is written by python, compression runs in a separate process that can use every core
+                compressProc = subprocess.Popen(compressCmd, stdin=subprocess.PIPE, stdout=archiveFile)
+                try:
+                    self.writeTar(sourcePath, compressProc.stdin, 'w|', byteProgress)
+                finally:
+                    compressProc.stdin.close()
+                    returnCode = compressProc.wait()
+                if returnCode != 0:
+                    raise OSError(f"'{compressCmd[0]}' Exited With Code {returnCode}")
         shutil.rmtree(sourcePath) if os.path.isdir(sourcePath) else os.remove(sourcePath)
+        return archivePath
+
+    def compressVolumes(self, sourcePath: str, compressionEngine: str, volumeSize: int,
+                        byteProgress: typing.Optional['ByteProgress'] = None) -> str:
+        archiveStream = ArchiveStream(self, sourcePath, compressionEngine, byteProgress)
+        # volumes go into one folder so the mirror still holds a single entry for the upload
+        volumeWriter = VolumeWriter(sourcePath + '.volumes', archiveStream.archiveName, volumeSize)
+        try:
+            while True:
+                streamChunk = archiveStream.read(FileSplitter.chunkSize)
+                if not streamChunk:
+                    break
+                volumeWriter.write(streamChunk)
+            volumeWriter.close()
+            archiveStream.close()
+        except Exception:
+            archiveStream.abort()
+            volumeWriter.close()
+            shutil.rmtree(volumeWriter.volumeDir, ignore_errors=True)
+            raise
+        if len(volumeWriter.volumePaths) > 1:
+            return volumeWriter.volumeDir
+        # everything fit into one volume, it becomes a plain archive
+        archivePath = os.path.join(os.path.dirname(sourcePath), archiveStream.archiveName)
+        os.rename(volumeWriter.volumePaths[0], archivePath)
+        shutil.rmtree(volumeWriter.volumeDir)
+        return archivePath
+
+    def writeStreamParts(self, archiveStream: 'ArchiveStream', partDir: str, partSize: int, partPipeline: 'PartPipeline') -> None:
+        # parts are cut from the archive stream as it is compressed and handed to partPipeline as soon as each is closed
+        partIndex: int = 0
+        while True:
+            partPipeline.reserve()
+            partPath = os.path.join(partDir, f'{archiveStream.archiveName}.{str(partIndex + 1).zfill(3)}')
+            partWritten: int = 0
+            with open(partPath, 'wb') as partFile:
+                while partWritten < partSize:
+                    streamChunk = archiveStream.read(min(FileSplitter.chunkSize, partSize - partWritten))
+                    if not streamChunk:
+                        break
+                    partFile.write(streamChunk)
+                    partWritten += len(streamChunk)
+            if partWritten == 0:
+                os.remove(partPath)
+                partPipeline.release()
+                return
+            if partIndex == 0 and partWritten < partSize:
+                # the whole archive fit into one part, it is sent under its own name
+                os.rename(partPath, os.path.join(partDir, archiveStream.archiveName))
+                partPath = os.path.join(partDir, archiveStream.archiveName)
+            partPipeline.submit(partPath, os.path.basename(partPath))
+            if partWritten < partSize:
+                return
+            partIndex += 1
+
+    def openArchiveStream(self, sourcePath: str, compressionEngine: str,
+                          byteProgress: typing.Optional['ByteProgress'] = None) -> 'ArchiveStream':
+        return ArchiveStream(self, sourcePath, self.getStoreEngine(sourcePath, self.getEngine(compressionEngine)), byteProgress)
+
+    def writeTar(self, sourcePath: str, fileObj: typing.BinaryIO, tarMode: str,
+                 byteProgress: typing.Optional['ByteProgress'] = None) -> None:
+        # a streamed tar needs no temp folder, the source is added under its own name
+        with tarfile.open(fileobj=fileObj, mode=tarMode, bufsize=self.tarBufSize) as tarStream:
+            self.addTarMember(tarStream, sourcePath, os.path.basename(sourcePath), byteProgress)
+        if byteProgress:
+            byteProgress.complete()
+
+    def addTarMember(self, tarStream: tarfile.TarFile, memberPath: str, memberName: str,
+                     byteProgress: typing.Optional['ByteProgress']) -> None:
+        # same walk as TarFile.add(), but file contents are read through ProgressReader so every input byte is counted
+        tarInfo = tarStream.gettarinfo(memberPath, arcname=memberName)
+        if tarInfo is None:
+            self.logger.warning(f"Skipping Unsupported File Type: '{memberPath}'")
+            return
+        if tarInfo.isreg():
+            with open(memberPath, 'rb') as memberFile:
+                tarStream.addfile(tarInfo, (ProgressReader(memberFile, byteProgress) if byteProgress else memberFile))
+        else:
+            tarStream.addfile(tarInfo)
+        if tarInfo.isdir():
+            for childName in sorted(os.listdir(memberPath)):
+                self.addTarMember(tarStream, os.path.join(memberPath, childName), f'{memberName}/{childName}', byteProgress)
 
 
 class DecompressionHelper(BaseHelper):
@@ -1697,28 +3077,224 @@ class DecompressionHelper(BaseHelper):
 
     def initHelper(self) -> None:
         super().initHelper()
+        # [pattern, backend] tried in order; no backend marks a later part of a set, it is extracted with the first part
+        self.archivePatterns: typing.List[typing.List[typing.Optional[str]]] = \
+            [[r'\.part0*1\.rar$', 'rar'], [r'\.part\d+\.rar$', None], [r'\.r\d{2,3}$', None], [r'\.rar$', 'rar'],
+             [r'\.(7z|zip)\.0*1$', '7z'], [r'\.(7z|zip)\.\d+$', None], [r'\.7z$', '7z'], [r'\.zip$', 'zip'],
+             [r'\.(tar|tar\.gz|tgz|tar\.bz2|tbz2?|tar\.xz|txz|tar\.zst|tzst)$', 'tar']]
+        # [first part pattern, pattern every part of the set matches after the common stem]
+        self.partPatterns: typing.List[typing.List[str]] = \
+            [[r'\.part0*1\.rar$', r'\.part\d+\.rar$'], [r'\.rar$', r'\.(rar|r\d{2,3})$'],
+             [r'\.7z\.0*1$', r'\.7z\.\d+$'], [r'\.zip\.0*1$', r'\.zip\.\d+$']]
+        self.zipParallelMinMembers: int = 64
+        self.zipWorkers: int = min(8, os.cpu_count() or 1)
+        self.copyChunkSize: int = 4 * 1024 * 1024
+        self.streamMembersOnDisk: int = 4
 
     def addDecompression(self, mirrorInfo: 'MirrorInfo') -> None:
-        self.decompressArchive(os.path.join(mirrorInfo.path, os.listdir(mirrorInfo.path)[0]))
+        sourcePath = os.path.join(mirrorInfo.path, os.listdir(mirrorInfo.path)[0])
+        archiveSets = self.getArchiveSets(sourcePath)
+        if not archiveSets:
+            self.logger.warning(f'{mirrorInfo.uid} : No Supported Archive Found, Uploading As Is !')
+        byteProgress = ByteProgress(mirrorInfo, sum([archiveSet['setSize'] for archiveSet in archiveSets]),
+                                    self.botHelper.statusHelper.statusUpdateInterval)
+        try:
+            for archiveSet in archiveSets:
+                self.decompressArchive(archiveSet, byteProgress)
+        except (OSError, tarfile.TarError, zipfile.BadZipFile):
+            self.logger.exception(f'{mirrorInfo.uid} : Decompression Failed !')
+            self.botHelper.bot.sendMessage(text='Decompression Failed !', parse_mode='HTML',
+                                           chat_id=mirrorInfo.chatId, reply_to_message_id=mirrorInfo.msgId)
+            self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.decompressionError)
+            return
+        byteProgress.complete()
         self.botHelper.mirrorListenerHelper.updateStatus(mirrorInfo.uid, MirrorStatus.decompressionComplete)
 
     def cancelDecompression(self, uid: str) -> None:
         raise NotImplementedError
 
-    def decompressArchive(self, archivePath: str) -> None:
-        archiveFormat = ''
-        for archiveFileExtension in self.botHelper.mirrorHelper.supportedArchiveFormats.values():
-            if archivePath.endswith(archiveFileExtension):
-                for archiveFileFormat in self.botHelper.mirrorHelper.supportedArchiveFormats.keys():
-                    if self.botHelper.mirrorHelper.supportedArchiveFormats[archiveFileFormat] == archiveFileExtension:
-                        archiveFormat = archiveFileFormat
-                        break
+    def isStreamable(self, sourcePath: str) -> bool:
+        if not os.path.isfile(sourcePath):
+            return False
+        archiveSets = self.getArchiveSets(sourcePath)
+        # rar and 7z go through external tools that write the whole set at once
+        return len(archiveSets) == 1 and archiveSets[0]['backend'] in ['tar', 'zip']
+
+    def getStreamSize(self, archivePath: str) -> int:
+        if archivePath.lower().endswith('.zip'):
+            with zipfile.ZipFile(archivePath) as zipArchive:
+                return sum([zipMember.file_size for zipMember in zipArchive.infolist()])
+        # a tar has no index, the archive size is the closest known figure
+        return os.path.getsize(archivePath)
+
+    def streamExtract(self, archivePath: str, uploadMember: typing.Callable[[str, str], None], uploadWorkers: int) -> None:
+        memberDir = self.getArchiveSets(archivePath)[0]['folderPath']
+        # extraction runs ahead of the uploads by at most streamMembersOnDisk members
+        memberPipeline = PartPipeline(uploadMember, self.streamMembersOnDisk, uploadWorkers, name='streamExtract')
+        try:
+            for memberName, memberReader in self.iterMembers(archivePath):
+                memberPipeline.reserve()
+                memberPath = os.path.join(memberDir, memberName)
+                os.makedirs(os.path.dirname(memberPath), exist_ok=True)
+                with open(memberPath, 'wb') as memberFile:
+                    shutil.copyfileobj(memberReader, memberFile, self.copyChunkSize)
+                memberPipeline.submit(memberPath, memberName)
+            memberPipeline.finish()
+        except BaseException:
+            memberPipeline.abort()
+            raise
+
+    def iterMembers(self, archivePath: str) -> typing.Iterator[typing.Tuple[str, typing.BinaryIO]]:
+        if archivePath.lower().endswith('.zip'):
+            # central directory order, every member is read straight from its offset
+            with zipfile.ZipFile(archivePath) as zipArchive:
+                for zipMember in zipArchive.infolist():
+                    memberName = self.safeMemberName(zipMember.filename)
+                    if zipMember.is_dir() or not memberName:
+                        continue
+                    with zipArchive.open(zipMember) as memberReader:
+                        yield memberName, memberReader
+            return
+        zstdProc: typing.Optional[subprocess.Popen] = None
+        if re.search(r'\.(tar\.zst|tzst)$', archivePath, re.IGNORECASE):
+            # tarfile has no zstd support, zstd decompresses into the pipe instead
+            zstdProc = subprocess.Popen(['zstd', '-d', '-c', '-q', archivePath], stdout=subprocess.PIPE)
+        archiveFile = (zstdProc.stdout if zstdProc else open(archivePath, 'rb'))
+        try:
+            with tarfile.open(fileobj=archiveFile, mode='r|*') as tarArchive:
+                for tarMember in tarArchive:
+                    memberName = self.safeMemberName(tarMember.name)
+                    if not tarMember.isreg() or not memberName:
+                        continue
+                    yield memberName, tarArchive.extractfile(tarMember)
+            if zstdProc and zstdProc.wait() != 0:
+                raise OSError(f"'zstd' Exited With Code {zstdProc.returncode}")
+        finally:
+            archiveFile.close()
+            if zstdProc and zstdProc.poll() is None:
+                zstdProc.kill()
+                zstdProc.wait()
+
+    @staticmethod
+    def safeMemberName(memberName: str) -> str:
+        # members pointing outside the extraction folder are dropped
+        memberName = os.path.normpath(memberName.lstrip('/'))
+        return ('' if (memberName == '.' or memberName.startswith('..')) else memberName)
+
+    def getArchiveSets(self, sourcePath: str) -> typing.List[typing.Dict[str, typing.Any]]:
+        archivePaths = [sourcePath] if os.path.isfile(sourcePath) else \
+            sorted([os.path.join(path, file) for path, dirs, files in os.walk(sourcePath) for file in files])
+        archiveSets: typing.List[typing.Dict[str, typing.Any]] = []
+        for archivePath in archivePaths:
+            dirPath, fileName = os.path.split(archivePath)
+            for archivePattern, archiveBackend in self.archivePatterns:
+                archiveMatch = re.search(archivePattern, fileName, re.IGNORECASE)
+                if not archiveMatch:
+                    continue
+                if archiveBackend:
+                    partPaths = self.getSetParts(archivePath)
+                    archiveSets.append({'backend': archiveBackend, 'archivePath': archivePath, 'partPaths': partPaths,
+                                        'folderPath': os.path.join(dirPath, (fileName[:archiveMatch.start()] or 'extracted')),
+                                        'setSize': sum([os.path.getsize(partPath) for partPath in partPaths])})
                 break
-        if archiveFormat == '':
+        return archiveSets
+
+    def getSetParts(self, archivePath: str) -> typing.List[str]:
+        dirPath, fileName = os.path.split(archivePath)
+        for firstPartPattern, partPattern in self.partPatterns:
+            setMatch = re.search(firstPartPattern, fileName, re.IGNORECASE)
+            if setMatch:
+                partRegex = re.compile(re.escape(fileName[:setMatch.start()]) + partPattern, re.IGNORECASE)
+                return sorted([os.path.join(dirPath, partName) for partName in os.listdir(dirPath) if partRegex.match(partName)])
+        return [archivePath]
+
+    def decompressArchive(self, archiveSet: typing.Dict[str, typing.Any], byteProgress: 'ByteProgress') -> None:
+        self.logger.info(f"Extracting '{archiveSet['archivePath']}' [{archiveSet['backend']} | {len(archiveSet['partPaths'])} Parts]...")
+        os.makedirs(archiveSet['folderPath'], exist_ok=True)
+        if archiveSet['backend'] == 'zip':
+            self.extractZip(archiveSet['archivePath'], archiveSet['folderPath'], byteProgress)
+        elif archiveSet['backend'] == 'tar':
+            self.extractTar(archiveSet['archivePath'], archiveSet['folderPath'], byteProgress)
+        else:
+            self.extractExternal(self.getExtractCmd(archiveSet['backend'], archiveSet['archivePath'], archiveSet['folderPath']),
+                                 archiveSet['setSize'], byteProgress)
+        for partPath in archiveSet['partPaths']:
+            os.remove(partPath)
+
+    @staticmethod
+    def getExtractCmd(archiveBackend: str, archivePath: str, folderPath: str) -> typing.List[str]:
+        # -bsp1 / unrar's default output carry a running percentage, extractExternal() turns it into progress
+        if archiveBackend == 'rar' and shutil.which('unrar'):
+            return ['unrar', 'x', f'-mt{os.cpu_count()}', '-o+', '-y', archivePath, folderPath + '/']
+        if shutil.which('7z'):
+            return ['7z', 'x', '-mmt=on', '-aoa', '-y', '-bso0', '-bsp1', f'-o{folderPath}', archivePath]
+        if shutil.which('bsdtar'):
+            return ['bsdtar', '-x', '-f', archivePath, '-C', folderPath]
+        raise OSError(f"No Extractor Found For '{archivePath}'")
+
+    def extractExternal(self, extractCmd: typing.List[str], setSize: int, byteProgress: 'ByteProgress') -> None:
+        extractProc = subprocess.Popen(extractCmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        outputTail: bytes = b''
+        sizeReported: int = 0
+        for outputChunk in iter(lambda: extractProc.stdout.read1(4096), b''):
+            outputTail = (outputTail + outputChunk)[-4096:]
+            percentMatches = re.findall(rb'(\d{1,3})%', outputChunk)
+            if percentMatches:
+                sizeCurrent = min(int(percentMatches[-1]), 100) * setSize // 100
+                if sizeCurrent > sizeReported:
+                    byteProgress.update(sizeCurrent - sizeReported)
+                    sizeReported = sizeCurrent
+        returnCode = extractProc.wait()
+        if returnCode != 0:
+            raise OSError(f"'{extractCmd[0]}' Exited With Code {returnCode}: {outputTail.decode(errors='replace').strip()[-512:]}")
+        byteProgress.update(setSize - sizeReported)
+
+    def extractTar(self, archivePath: str, folderPath: str, byteProgress: 'ByteProgress') -> None:
+        with open(archivePath, 'rb') as archiveFile:
+            archiveReader = ProgressReader(archiveFile, byteProgress)
+            if not shutil.which('bsdtar'):
+                # stream mode reads the archive front to back once, so bytes read follow the extraction
+                with tarfile.open(fileobj=archiveReader, mode='r|*') as tarArchive:
+                    tarArchive.extractall(folderPath)
+                return
+            # libarchive picks the decompressor itself (zstd included), the archive is fed through stdin to count it
+            extractProc = subprocess.Popen(['bsdtar', '-x', '-f', '-', '-C', folderPath], stdin=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            try:
+                shutil.copyfileobj(archiveReader, extractProc.stdin, self.copyChunkSize)
+            except BrokenPipeError:
+                # bsdtar quit early, its exit code says why
+                pass
+            finally:
+                extractProc.stdin.close()
+            returnCode = extractProc.wait()
+            if returnCode != 0:
+                raise OSError(f"'bsdtar' Exited With Code {returnCode}")
+
+    def extractZip(self, archivePath: str, folderPath: str, byteProgress: 'ByteProgress') -> None:
+        with zipfile.ZipFile(archivePath) as zipArchive:
+            zipMembers = zipArchive.infolist()
+        if len(zipMembers) < self.zipParallelMinMembers:
+            self.extractZipMembers(archivePath, folderPath, zipMembers, byteProgress)
             return
-        folderPath = archivePath.replace(self.botHelper.mirrorHelper.supportedArchiveFormats[archiveFormat], '')
-        shutil.unpack_archive(archivePath, folderPath, archiveFormat)
-        os.remove(archivePath)
+        # folders are made up front, workers creating the same parent at once would race
+        for zipMember in zipMembers:
+            memberDir = os.path.realpath(os.path.join(folderPath, os.path.dirname(zipMember.filename)))
+            if os.path.commonpath([memberDir, os.path.realpath(folderPath)]) == os.path.realpath(folderPath):
+                os.makedirs(memberDir, exist_ok=True)
+        # each worker opens its own handle, reads through a shared ZipFile are serialized
+        memberGroups = [zipMembers[workerIndex::self.zipWorkers] for workerIndex in range(self.zipWorkers)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.zipWorkers, thread_name_prefix='extractZip') as zipExecutor:
+            extractFutures = [zipExecutor.submit(self.extractZipMembers, archivePath, folderPath, memberGroup, byteProgress)
+                              for memberGroup in memberGroups]
+            for extractFuture in extractFutures:
+                extractFuture.result()
+
+    @staticmethod
+    def extractZipMembers(archivePath: str, folderPath: str, zipMembers: typing.List[zipfile.ZipInfo], byteProgress: 'ByteProgress') -> None:
+        with zipfile.ZipFile(archivePath) as zipArchive:
+            for zipMember in zipMembers:
+                zipArchive.extract(zipMember, folderPath)
+                byteProgress.update(zipMember.compress_size)
 
 
 class StatusHelper(BaseHelper):
@@ -1728,80 +3304,156 @@ class StatusHelper(BaseHelper):
     def initHelper(self) -> None:
         super().initHelper()
         self.updaterLock = threading.Lock()
-        self.isInitThread: bool = False
-        self.isUpdateStatus: bool = False
+        self.updaterEvent = threading.Event()
+        self.isSchedulerRunning: bool = False
         self.statusUpdateInterval: int = int(self.botHelper.configHelper.configVars[self.botHelper.configHelper.optVars[5]])
-        self.msgId: int = 0
-        self.chatId: int = 0
-        self.lastStatusMsgId: int = 0
-        self.lastStatusMsgTxt: str = ''
+        # unchanged ticks double the interval up to statusIdleInterval, a change drops it back to statusUpdateInterval
+        self.statusIdleInterval: int = self.statusUpdateInterval * 4
+        self.statusMinInterval: float = 1.0
+        # chatId : {'msgId', 'statusMsgId', 'statusMsgTxt', 'page', 'numPages'}, one live status message per chat
+        self.statusMsgs: typing.Dict[int, typing.Dict[str, typing.Union[int, str]]] = {}
+        # uid : [fragmentKey, fragmentTxt], a mirror is only rendered again once its progress has moved
+        self.statusFragments: typing.Dict[str, typing.List[typing.Any]] = {}
+        # telegram rejects messages over 4096 characters, the rest is left for the page footer
+        self.statusPageMaxLen: int = 4000
+        self.statusPageHandler = telegram.ext.CallbackQueryHandler(callback=self.statusPageCallBack, pattern=r'^statusPage\|', run_async=True)
 
     def addStatus(self, chatId: int, msgId: int) -> None:
+        statusMsgId = self.botHelper.bot.sendMessage(text='...', parse_mode='HTML', chat_id=chatId, reply_to_message_id=msgId).message_id
         with self.updaterLock:
-            if self.botHelper.mirrorHelper.mirrorInfos != {}:
-                self.isUpdateStatus = True
-            else:
-                self.isUpdateStatus = False
-            if self.lastStatusMsgId == 0:
-                self.isInitThread = True
-            if self.lastStatusMsgId != 0:
-                self.botHelper.bot.deleteMessage(chat_id=self.chatId, message_id=self.lastStatusMsgId)
-            self.chatId = chatId
-            self.msgId = msgId
-            self.lastStatusMsgId = self.botHelper.bot.sendMessage(text='...', parse_mode='HTML', chat_id=self.chatId,
-                                                                  reply_to_message_id=self.msgId).message_id
-            if self.isInitThread:
-                self.isInitThread = False
-                self.botHelper.threadingHelper.initThread(target=self.updateStatusMsg, name='statusUpdaterStart')
-
-    def getStatusMsgTxt(self) -> str:
-        statusMsgTxt = ''
-        for uid in self.botHelper.mirrorHelper.mirrorInfos.keys():
-            mirrorInfo: MirrorInfo = self.botHelper.mirrorHelper.mirrorInfos[uid]
-            statusMsgTxt += f'<code>{mirrorInfo.uid}</code> | {mirrorInfo.status}\n'
-            if mirrorInfo.status in [MirrorStatus.downloadProgress, MirrorStatus.uploadProgress]:
-                if mirrorInfo.status == MirrorStatus.downloadProgress and mirrorInfo.isAriaDownload:
-                    self.botHelper.ariaHelper.updateProgress(mirrorInfo.uid)
-                statusMsgTxt += f'S: {self.botHelper.getHelper.readableSize(mirrorInfo.sizeCurrent)} | ' \
-                                f'{self.botHelper.getHelper.readableSize(mirrorInfo.sizeTotal)} | ' \
-                                f'{self.botHelper.getHelper.readableSize(mirrorInfo.sizeTotal - mirrorInfo.sizeCurrent)}\n' \
-                                f'P: <code>{self.botHelper.getHelper.progressBar(mirrorInfo.progressPercent)}</code> | ' \
-                                f'{mirrorInfo.progressPercent}% | ' \
-                                f'{self.botHelper.getHelper.readableSize(mirrorInfo.speedCurrent)}/s\n' \
-                                f'T: {self.botHelper.getHelper.readableTime(int(mirrorInfo.timeCurrent - mirrorInfo.timeStart))} | ' \
-                                f'{self.botHelper.getHelper.readableTime(int(mirrorInfo.timeEnd - mirrorInfo.timeCurrent))}\n'
-                statusMsgTxt += (f'nS: {mirrorInfo.numSeeders} nL: {mirrorInfo.numLeechers}\n' if mirrorInfo.isTorrent else '')
+            lastStatusMsg = self.statusMsgs.get(chatId)
+            self.statusMsgs[chatId] = {'msgId': msgId, 'statusMsgId': statusMsgId, 'statusMsgTxt': '', 'page': 0, 'numPages': 1}
+            isStartScheduler = not self.isSchedulerRunning
+            self.isSchedulerRunning = True
+        if lastStatusMsg:
+            # only the older message of the same chat is replaced, other chats keep theirs
+            try:
+                self.botHelper.bot.deleteMessage(chat_id=chatId, message_id=lastStatusMsg['statusMsgId'])
+            except telegram.error.TelegramError:
+                self.logger.warning(f"Deleting Status Message Failed: {lastStatusMsg['statusMsgId']}")
+        if isStartScheduler:
+            self.botHelper.threadingHelper.initThread(target=self.statusScheduler, name='statusScheduler')
+        self.wakeStatus()
+
+    def wakeStatus(self) -> None:
+        self.updaterEvent.set()
+
+    def getChatFragments(self, mirrorInfos: typing.List['MirrorInfo']) -> typing.Dict[int, typing.List[str]]:
+        # every mirror is rendered at most once per tick, no matter how many chats show it
+        chatFragments: typing.Dict[int, typing.List[str]] = {}
+        for mirrorInfo in mirrorInfos:
+            chatFragments.setdefault(mirrorInfo.chatId, []).append(self.getMirrorStatusTxt(mirrorInfo))
+        for uid in set(self.statusFragments.keys()) - set([mirrorInfo.uid for mirrorInfo in mirrorInfos]):
+            self.statusFragments.pop(uid)
+        return chatFragments
+
+    def getMirrorStatusTxt(self, mirrorInfo: 'MirrorInfo') -> str:
+        isProgress = mirrorInfo.status in [MirrorStatus.downloadProgress, MirrorStatus.compressionProgress,
+                                           MirrorStatus.decompressionProgress, MirrorStatus.uploadProgress]
+        if isProgress and mirrorInfo.status == MirrorStatus.downloadProgress and mirrorInfo.isAriaDownload:
+            self.botHelper.ariaHelper.updateProgress(mirrorInfo.uid)
+        fragmentKey = [mirrorInfo.status, mirrorInfo.sizeCurrent, mirrorInfo.sizeTotal, mirrorInfo.speedCurrent,
+                       mirrorInfo.timeCurrent, mirrorInfo.numSeeders, mirrorInfo.numLeechers]
+        if mirrorInfo.uid in self.statusFragments and self.statusFragments[mirrorInfo.uid][0] == fragmentKey:
+            return self.statusFragments[mirrorInfo.uid][1]
+        statusMsgTxt = f'<code>{mirrorInfo.uid}</code> | {mirrorInfo.status}\n'
+        if isProgress:
+            statusMsgTxt += f'S: {self.botHelper.getHelper.readableSize(mirrorInfo.sizeCurrent)} | ' \
+                            f'{self.botHelper.getHelper.readableSize(mirrorInfo.sizeTotal)} | ' \
+                            f'{self.botHelper.getHelper.readableSize(mirrorInfo.sizeTotal - mirrorInfo.sizeCurrent)}\n' \
+                            f'P: <code>{self.botHelper.getHelper.progressBar(mirrorInfo.progressPercent)}</code> | ' \
+                            f'{mirrorInfo.progressPercent}% | ' \
+                            f'{self.botHelper.getHelper.readableSize(mirrorInfo.speedCurrent)}/s\n' \
+                            f'T: {self.botHelper.getHelper.readableTime(int(mirrorInfo.timeCurrent - mirrorInfo.timeStart))} | ' \
+                            f'{self.botHelper.getHelper.readableTime(int(mirrorInfo.timeEnd - mirrorInfo.timeCurrent))}\n'
+            statusMsgTxt += (f'nS: {mirrorInfo.numSeeders} nL: {mirrorInfo.numLeechers}\n' if mirrorInfo.isTorrent else '')
+        self.statusFragments[mirrorInfo.uid] = [fragmentKey, statusMsgTxt]
         return statusMsgTxt
 
-    def updateStatusMsg(self) -> None:
+    def getStatusPages(self, fragments: typing.List[str]) -> typing.List[str]:
+        if not fragments:
+            return ['No Active Downloads !']
+        statusPages: typing.List[str] = ['']
+        for fragment in fragments:
+            if statusPages[-1] and len(statusPages[-1]) + len(fragment) > self.statusPageMaxLen:
+                statusPages.append('')
+            statusPages[-1] += fragment
+        if len(statusPages) > 1:
+            statusPages = [f'{statusPage}\nPage: {pageIndex + 1} of {len(statusPages)}' for pageIndex, statusPage in enumerate(statusPages)]
+        return statusPages
+
+    @staticmethod
+    def statusPageMarkup(numPages: int) -> typing.Optional[telegram.InlineKeyboardMarkup]:
+        if numPages < 2:
+            return None
+        return telegram.InlineKeyboardMarkup([[telegram.InlineKeyboardButton(text=buttonTxt, callback_data=f'statusPage|{buttonData}')
+                                               for buttonTxt, buttonData in [('<', 'prev'), ('>', 'next')]]])
+
+    def statusPageCallBack(self, update: telegram.Update, _: telegram.ext.CallbackContext) -> None:
+        query = update.callback_query
+        _, queryData = query.data.split('|')
         with self.updaterLock:
-            if self.isUpdateStatus:
-                if self.botHelper.mirrorHelper.mirrorInfos:
-                    statusMsgTxt = self.getStatusMsgTxt()
-                    if statusMsgTxt != self.lastStatusMsgTxt:
-                        self.botHelper.bot.editMessageText(text=statusMsgTxt, parse_mode='HTML', chat_id=self.chatId,
-                                                           message_id=self.lastStatusMsgId)
-                        self.lastStatusMsgTxt = statusMsgTxt
-                        time.sleep(self.statusUpdateInterval - 1)
-                    time.sleep(1)
-                    self.botHelper.threadingHelper.initThread(target=self.updateStatusMsg, name='statusUpdaterContinue')
-                    return
-                if not self.botHelper.mirrorHelper.mirrorInfos:
-                    self.isUpdateStatus = False
-                    self.botHelper.threadingHelper.initThread(target=self.updateStatusMsg, name='statusUpdaterEnd')
-                    return
-            if not self.isUpdateStatus:
-                self.botHelper.bot.editMessageText(text='No Active Downloads !', parse_mode='HTML',
-                                                   chat_id=self.chatId, message_id=self.lastStatusMsgId)
-                self.resetAllDat()
+            statusMsg = self.statusMsgs.get(query.message.chat.id)
+            isExpired = (not statusMsg or statusMsg['statusMsgId'] != query.message.message_id)
+            if not isExpired:
+                statusMsg['page'] = (statusMsg['page'] + (1 if queryData == 'next' else -1)) % statusMsg['numPages']
+        if isExpired:
+            query.answer(text='Status Message Expired !')
+            return
+        query.answer()
+        self.wakeStatus()
 
-    def resetAllDat(self) -> None:
-        self.isInitThread = False
-        self.isUpdateStatus = False
-        self.msgId = 0
-        self.chatId = 0
-        self.lastStatusMsgId = 0
-        self.lastStatusMsgTxt = ''
+    def statusScheduler(self) -> None:
+        # the one thread that edits status messages, it lives as long as there is something to show
+        statusInterval: float = self.statusUpdateInterval
+        while True:
+            timeTick = time.time()
+            # cleared before the snapshot, a wake-up arriving after it is kept for the next round instead of lost
+            self.updaterEvent.clear()
+            with self.updaterLock:
+                # only the snapshot is taken under the lock, rendering and editing run without it
+                mirrorInfos = list(self.botHelper.mirrorHelper.mirrorInfos.values())
+                statusMsgs = {chatId: dict(statusMsg) for chatId, statusMsg in self.statusMsgs.items()}
+                if not mirrorInfos:
+                    self.isSchedulerRunning = False
+                    self.statusMsgs = {}
+                    self.statusFragments = {}
+                    break
+            renderStart = time.perf_counter()
+            chatFragments = self.getChatFragments(mirrorInfos)
+            chatPages = {chatId: self.getStatusPages(chatFragments.get(chatId, [])) for chatId in statusMsgs.keys()}
+            self.logger.debug(f'Status Rendered: {len(mirrorInfos)} Mirrors, {len(statusMsgs)} Chats '
+                              f'[{round((time.perf_counter() - renderStart) * 1000, ndigits=2)} ms]')
+            isChanged: bool = False
+            for chatId, statusMsg in statusMsgs.items():
+                statusPages = chatPages[chatId]
+                pageIndex = min(statusMsg['page'], len(statusPages) - 1)
+                if statusPages[pageIndex] == statusMsg['statusMsgTxt']:
+                    continue
+                self.editStatusMsg(chatId, statusMsg['statusMsgId'], statusPages[pageIndex], len(statusPages))
+                isChanged = True
+            if isChanged:
+                statusInterval = self.statusUpdateInterval
+            else:
+                statusInterval = min(statusInterval * 2, self.statusIdleInterval)
+            self.updaterEvent.wait(statusInterval)
+            # an early wake-up still keeps edits statusMinInterval apart
+            time.sleep(max(0.0, timeTick + self.statusMinInterval - time.time()))
+        for chatId, statusMsg in statusMsgs.items():
+            self.editStatusMsg(chatId, statusMsg['statusMsgId'], 'No Active Downloads !', 1)
+
+    def editStatusMsg(self, chatId: int, statusMsgId: int, statusMsgTxt: str, numPages: int) -> None:
+        try:
+            self.botHelper.bot.editMessageText(text=statusMsgTxt, parse_mode='HTML', chat_id=chatId, message_id=statusMsgId,
+                                               reply_markup=self.statusPageMarkup(numPages))
+        except telegram.error.TelegramError:
+            self.logger.warning(f'Editing Status Message Failed: {statusMsgId}')
+        with self.updaterLock:
+            # the chat may have asked for a new status message meanwhile, that one starts from scratch
+            if chatId in self.statusMsgs and self.statusMsgs[chatId]['statusMsgId'] == statusMsgId:
+                # a page turned meanwhile is kept, it only gets pulled back inside the page count
+                self.statusMsgs[chatId].update({'statusMsgTxt': statusMsgTxt, 'numPages': numPages,
+                                                'page': min(self.statusMsgs[chatId]['page'], numPages - 1)})
 
 
 class MirrorListenerHelper(BaseHelper):
@@ -1878,10 +3530,12 @@ class MirrorListenerHelper(BaseHelper):
         # TODO: implement cancel callbacks for various download and upload types
         shutil.rmtree(mirrorInfo.path)
         self.botHelper.mirrorHelper.mirrorInfos.pop(mirrorInfo.uid)
+        self.botHelper.statusHelper.wakeStatus()
 
     def onCompleteMirror(self, mirrorInfo: 'MirrorInfo') -> None:
         shutil.rmtree(mirrorInfo.path)
         self.botHelper.mirrorHelper.mirrorInfos.pop(mirrorInfo.uid)
+        self.botHelper.statusHelper.wakeStatus()
         if mirrorInfo.isGoogleDriveUpload or mirrorInfo.isMegaUpload:
             self.botHelper.bot.sendMessage(text=f'Uploaded: [{mirrorInfo.uid}] [{mirrorInfo.uploadUrl}]',
                                            parse_mode='HTML', chat_id=mirrorInfo.chatId, reply_to_message_id=mirrorInfo.msgId)
@@ -1931,7 +3585,23 @@ class MirrorListenerHelper(BaseHelper):
         self.updateStatus(mirrorInfo.uid, MirrorStatus.cancelMirror)
         self.checkDownloadQueue()
 
+    def isPipedVolumes(self, mirrorInfo: 'MirrorInfo') -> bool:
+        # volumes are uploaded as soon as they are closed, only the mega sdk needs the finished archive on disk
+        return not mirrorInfo.isMegaUpload and bool(self.botHelper.compressionHelper.getVolumeSize(mirrorInfo))
+
     def onCompressionQueue(self, mirrorInfo: 'MirrorInfo') -> None:
+        if mirrorInfo.isMegaUpload:
+            # the mega sdk only uploads from paths, the archive has to be written to disk first
+            mirrorInfo.isStreamArchive = False
+        if mirrorInfo.isGoogleDriveUpload and self.botHelper.compressionHelper.getVolumeSize(mirrorInfo):
+            # a drive upload streams a single file, volumes are uploaded one by one into a folder instead
+            mirrorInfo.isStreamArchive = False
+        if mirrorInfo.isCompress and (mirrorInfo.isStreamArchive or self.isPipedVolumes(mirrorInfo)):
+            # compression runs inside the upload, the archive goes straight from the source into the upload target
+            self.compressionQueue.remove(mirrorInfo.uid)
+            self.uploadQueue.append(mirrorInfo.uid)
+            self.updateStatus(mirrorInfo.uid, MirrorStatus.uploadQueue)
+            return
         if not mirrorInfo.isCompress:
             self.compressionQueue.remove(mirrorInfo.uid)
             self.decompressionQueue.append(mirrorInfo.uid)
@@ -1968,6 +3638,14 @@ class MirrorListenerHelper(BaseHelper):
         self.checkCompressionQueue()
 
     def onDecompressionQueue(self, mirrorInfo: 'MirrorInfo') -> None:
+        if mirrorInfo.isDecompress and mirrorInfo.isStreamArchive:
+            if self.botHelper.decompressionHelper.isStreamable(os.path.join(mirrorInfo.path, os.listdir(mirrorInfo.path)[0])):
+                # members are extracted inside the upload and handed over one by one
+                self.decompressionQueue.remove(mirrorInfo.uid)
+                self.uploadQueue.append(mirrorInfo.uid)
+                self.updateStatus(mirrorInfo.uid, MirrorStatus.uploadQueue)
+                return
+            mirrorInfo.isStreamArchive = False
         if not mirrorInfo.isDecompress:
             self.decompressionQueue.remove(mirrorInfo.uid)
             self.uploadQueue.append(mirrorInfo.uid)
@@ -2045,67 +3723,143 @@ class MirrorListenerHelper(BaseHelper):
 
 
 class MegaApiWrapper:
-    def __init__(self, megaHelper: MegaHelper):
+    def __init__(self, megaHelper: MegaHelper, megaAuth: typing.Dict[str, str]):
         self.megaHelper = megaHelper
         self.logger = self.megaHelper.botHelper.loggingHelper.logger.bind(classname=self.__class__.__name__)
-        self.api = mega.MegaApi(self.megaHelper.botHelper.configHelper.configVars[self.megaHelper.botHelper.configHelper.optVars[4]]['apiKey'], None, None, 'tgmb-beta')
-        self.AsyncContinueEvent = threading.Event()
-        self.cloudDriveNode: mega.MegaNode
-        self.currWorkDir: mega.MegaNode
-
-    def AsyncDo(self, function: typing.Callable, args):
-        self.AsyncContinueEvent.clear()
-        function(*args)
-        self.AsyncContinueEvent.wait()
-
-    def downloadNode(self, dlNode: mega.MegaNode, dlPath: str) -> None:
+        self.apiKey: str = megaAuth.get('apiKey', '')
+        self.emailId: str = megaAuth.get('emailId', '')
+        self.passPhrase: str = megaAuth.get('passPhrase', '')
+        self.cachePath: str = os.path.join(self.megaHelper.botHelper.envVars['currWorkDir'], self.megaHelper.cacheDir, self.emailId)
+        self.sessionFile: str = os.path.join(self.cachePath, self.megaHelper.sessionFile)
+        os.makedirs(self.cachePath, exist_ok=True)
+        self.isLoggedIn: bool = False
+        self.activeTransfers: int = 0
+        self.bytesTransferred: int = 0
+        self.transferMax: int = 0
+        self.transferUsed: int = 0
+        self.overQuotaUntil: float = 0.0
+        # with a basePath the sdk keeps its node tree in a local cache, fetchNodes() then only loads the changes
+        self.api = mega.MegaApi(self.apiKey, self.cachePath, None, 'tgmb-beta')
+        self.cloudDriveNode: typing.Optional[mega.MegaNode] = None
+        self.currWorkDir: typing.Optional[mega.MegaNode] = None
+
+    def requestDo(self, function: typing.Callable, *args) -> 'MegaRequestFuture':
+        requestFuture = MegaRequestFuture(self.megaHelper)
+        function(*args, requestFuture)
+        requestFuture.wait()
+        if not requestFuture.isSuccess():
+            self.logger.error(f'Request Failed ({requestFuture.requestStr}); Error: {requestFuture.errorStr}')
+        return requestFuture
+
+    def downloadNode(self, dlNode: mega.MegaNode, dlPath: str, transferFuture: 'MegaTransferFuture') -> None:
         self.logger.debug('*** start: downloadNode ***')
-        self.AsyncDo(self.api.startDownload, (dlNode, os.path.join(dlPath, dlNode.getName())))
+        self.api.startDownload(dlNode, os.path.join(dlPath, dlNode.getName()), transferFuture)
+        transferFuture.wait()
         self.logger.debug('*** done: downloadNode ***')
 
-    def getFileNode(self, fileUrl: str) -> mega.MegaNode:
+    def getFileNode(self, fileUrl: str) -> typing.Optional[mega.MegaNode]:
         self.logger.debug('*** start: getFileNode ***')
-        self.AsyncDo(self.api.getPublicNode, (fileUrl,))
-        fileNode = self.megaHelper.apiListener.publicNode
+        requestFuture = self.requestDo(self.api.getPublicNode, fileUrl)
+        fileNode = (requestFuture.request.getPublicMegaNode() if requestFuture.isSuccess() else None)
         self.logger.debug('*** done: getFileNode ***')
         return fileNode
 
-    def getFolderNode(self, folderUrl: str) -> mega.MegaNode:
+    def getFolderNode(self, folderUrl: str) -> typing.Optional[mega.MegaNode]:
         self.logger.debug('*** start: getFolderNode ***')
-        self.AsyncDo(self.api.loginToFolder, (folderUrl,))
-        folderNode = self.api.authorizeNode(self.megaHelper.apiListener.rootNode)
+        # loginToFolder() replaces the session of the api it is called on, so every folder link gets its own api
+        folderApi = mega.MegaApi(self.apiKey, None, None, 'tgmb-beta')
+        folderNode = None
+        if self.requestDo(folderApi.loginToFolder, folderUrl).isSuccess():
+            if self.requestDo(folderApi.fetchNodes).isSuccess():
+                # only the api holding the folder's nodes can authorize them, the authorized node is then downloadable by self.api
+                folderNode = folderApi.authorizeNode(folderApi.getRootNode())
+            self.requestDo(folderApi.logout)
+        # the folder api is not reused, its sdk threads and node tree go with it
+        del folderApi
         self.logger.debug('*** done: getFolderNode ***')
         return folderNode
 
+    def createFolder(self, folderName: str, parentNode: mega.MegaNode) -> typing.Optional[mega.MegaNode]:
+        requestFuture = self.requestDo(self.api.createFolder, folderName, parentNode)
+        return (self.api.getNodeByHandle(requestFuture.request.getNodeHandle()) if requestFuture.isSuccess() else None)
+
+    def exportNode(self, node: mega.MegaNode) -> str:
+        requestFuture = self.requestDo(self.api.exportNode, node)
+        return (requestFuture.request.getLink() if requestFuture.isSuccess() else '')
+
+    def getNodeByPath(self, nodePath: str) -> typing.Optional[mega.MegaNode]:
+        node = self.cloudDriveNode
+        for nodeName in [nodeName for nodeName in nodePath.split('/') if nodeName]:
+            if node is None:
+                break
+            childNode = self.api.getChildNode(node, nodeName)
+            node = (childNode if childNode else self.createFolder(nodeName, node))
+        return node
+
     def login(self) -> None:
         self.logger.debug('*** start: login ***')
-        self.AsyncDo(self.api.login, (self.megaHelper.botHelper.configHelper.configVars[self.megaHelper.botHelper.configHelper.optVars[4]]['emailId'],
-                                      self.megaHelper.botHelper.configHelper.configVars[self.megaHelper.botHelper.configHelper.optVars[4]]['passPhrase']))
-        self.cloudDriveNode = self.megaHelper.apiListener.rootNode
-        self.currWorkDir = self.cloudDriveNode
+        isLoggedIn = False
+        if os.path.exists(self.sessionFile):
+            with open(self.sessionFile, 'rt') as sessionFile:
+                sessionStr = sessionFile.read().strip()
+            isLoggedIn = self.requestDo(self.api.fastLogin, sessionStr).isSuccess()
+            if isLoggedIn:
+                self.logger.debug('Resumed Session from sessionFile !')
+            else:
+                os.remove(self.sessionFile)
+        if not isLoggedIn:
+            isLoggedIn = self.requestDo(self.api.login, self.emailId, self.passPhrase).isSuccess()
+            if isLoggedIn:
+                with open(self.sessionFile, 'wt') as sessionFile:
+                    sessionFile.write(self.api.dumpSession())
+        if isLoggedIn:
+            self.requestDo(self.api.fetchNodes)
+            self.cloudDriveNode = self.api.getRootNode()
+            self.currWorkDir = self.cloudDriveNode
+        self.isLoggedIn = isLoggedIn
         self.logger.debug('*** done: login ***')
 
+    def localLogout(self) -> None:
+        self.logger.debug('*** start: localLogout ***')
+        self.requestDo(self.api.localLogout)
+        self.isLoggedIn = False
+        self.logger.debug('*** done: localLogout ***')
+
     def logout(self) -> None:
         self.logger.debug('*** start: logout ***')
-        self.AsyncDo(self.api.logout, ())
-        self.megaHelper.apiListener.rootNode = None
+        self.requestDo(self.api.logout)
+        self.isLoggedIn = False
+        if os.path.exists(self.sessionFile):
+            os.remove(self.sessionFile)
         self.logger.debug('*** done: logout ***')
 
     def whoami(self) -> None:
         self.logger.debug('*** start: whoami ***')
         self.logger.debug(f'My email: {self.api.getMyEmail()}')
-        self.AsyncDo(self.api.getAccountDetails, ())
+        requestFuture = self.requestDo(self.api.getAccountDetails)
+        if requestFuture.isSuccess():
+            accountDetails = requestFuture.request.getMegaAccountDetails()
+            self.transferMax = accountDetails.getTransferMax()
+            self.transferUsed = accountDetails.getTransferOwnUsed()
+            self.logger.debug('Account Details Received')
+            self.logger.debug(f'Storage: {accountDetails.getStorageUsed()} of {accountDetails.getStorageMax()} '
+                              f'({(accountDetails.getStorageUsed() / accountDetails.getStorageMax()) * 100} %)')
+            self.logger.debug(f'Pro level: {accountDetails.getProLevel()}')
         self.logger.debug('*** done: whoami ***')
 
+    def getMaskedEmailId(self) -> str:
+        emailUser, _, emailDomain = self.emailId.partition('@')
+        return f'{emailUser[:3]}***@{emailDomain}'
 
-class MegaApiListener(mega.MegaListener):
-    _NO_EVENT_ON = (mega.MegaRequest.TYPE_LOGIN, mega.MegaRequest.TYPE_FETCH_NODES)
+    def transferQuotaLeft(self) -> int:
+        # free accounts report no transferMax, their quota is unknown until the sdk runs into it
+        return ((self.transferMax - self.transferUsed) if self.transferMax else 0)
 
+
+class MegaApiListener(mega.MegaListener):
     def __init__(self, megaHelper: MegaHelper):
         self.megaHelper = megaHelper
         self.logger = self.megaHelper.botHelper.loggingHelper.logger.bind(classname=self.__class__.__name__)
-        self.rootNode = None
-        self.publicNode = None
         super().__init__()
 
     def onRequestStart(self, api: mega.MegaApi, request: mega.MegaRequest):
@@ -2113,46 +3867,17 @@ class MegaApiListener(mega.MegaListener):
 
     def onRequestFinish(self, api: mega.MegaApi, request: mega.MegaRequest, error: mega.MegaError):
         self.logger.debug(f'Request Finished ({request}); Result: {error}')
-        requestType = request.getType()
-        if requestType == mega.MegaRequest.TYPE_LOGIN:
-            api.fetchNodes()
-        elif requestType == mega.MegaRequest.TYPE_FETCH_NODES:
-            self.rootNode = api.getRootNode()
-        elif requestType == mega.MegaRequest.TYPE_GET_PUBLIC_NODE:
-            self.publicNode = request.getPublicMegaNode()
-        elif requestType == mega.MegaRequest.TYPE_ACCOUNT_DETAILS:
-            accountDetails = request.getMegaAccountDetails()
-            self.logger.debug('Account Details Received')
-            self.logger.debug(f'Storage: {accountDetails.getStorageUsed()} of {accountDetails.getStorageMax()} '
-                              f'({(accountDetails.getStorageUsed() / accountDetails.getStorageMax()) * 100} %)')
-            self.logger.debug(f'Pro level: {accountDetails.getProLevel()}')
-        if requestType not in self._NO_EVENT_ON:
-            self.megaHelper.apiWrapper.AsyncContinueEvent.set()
 
     def onRequestTemporaryError(self, api: mega.MegaApi, request: mega.MegaRequest, error: mega.MegaError):
         self.logger.debug(f'Request Temporary Error ({request}); Error: {error}')
 
     def onTransferFinish(self, api: mega.MegaApi, transfer: mega.MegaTransfer, error: mega.MegaError):
-        if transfer.getFileName() in [dlNode.getName() for dlNode in list(self.megaHelper.dlNodes.values())]:
-            uid = self.megaHelper.getUid(transfer.getFileName())
-            mirrorStatus = (MirrorStatus.downloadComplete if transfer.isFinished() else MirrorStatus.downloadError)
-            self.megaHelper.botHelper.mirrorListenerHelper.updateStatus(uid, mirrorStatus)
-            self.megaHelper.dlNodes.pop(uid)
         self.logger.debug(f'Transfer Finished ({transfer} {transfer.getFileName()}); Result: {error}')
-        self.megaHelper.apiWrapper.AsyncContinueEvent.set()
 
     def onTransferStart(self, api: mega.MegaApi, transfer: mega.MegaTransfer):
         self.logger.debug(f'Transfer Started ({transfer} {transfer.getFileName()})')
 
     def onTransferUpdate(self, api: mega.MegaApi, transfer: mega.MegaTransfer):
-        if transfer.getFileName() in [dlNode.getName() for dlNode in list(self.megaHelper.dlNodes.values())]:
-            uid = self.megaHelper.getUid(transfer.getFileName())
-            currVars: typing.Dict[str, typing.Union[int, float, str]] = \
-                {MirrorInfo.updatableVars[0]: transfer.getTotalBytes(),
-                 MirrorInfo.updatableVars[1]: transfer.getTransferredBytes(),
-                 MirrorInfo.updatableVars[2]: transfer.getSpeed(),
-                 MirrorInfo.updatableVars[3]: time.time()}
-            self.megaHelper.botHelper.mirrorHelper.mirrorInfos[uid].updateVars(currVars)
         self.logger.debug(f'Transfer Update ({transfer} {transfer.getFileName()}); '
                           f'Progress: {transfer.getTransferredBytes() / 1024} KB of {transfer.getTotalBytes() / 1024} KB, '
                           f'{transfer.getSpeed() / 1024} KB/s')
@@ -2167,7 +3892,97 @@ class MegaApiListener(mega.MegaListener):
     def onNodesUpdate(self, api: mega.MegaApi, nodes: mega.MegaNodeList):
         if nodes is not None:
             self.logger.debug(f'Nodes updated ({nodes.size()})')
-        self.megaHelper.apiWrapper.AsyncContinueEvent.set()
+
+
+class MegaRequestFuture(mega.MegaRequestListener):
+    def __init__(self, megaHelper: MegaHelper):
+        self.megaHelper = megaHelper
+        self.logger = self.megaHelper.botHelper.loggingHelper.logger.bind(classname=self.__class__.__name__)
+        self.finishEvent = threading.Event()
+        self.request: typing.Optional[mega.MegaRequest] = None
+        self.requestStr: str = ''
+        self.errorCode: int = mega.MegaError.API_OK
+        self.errorStr: str = ''
+        super().__init__()
+
+    def onRequestFinish(self, api: mega.MegaApi, request: mega.MegaRequest, error: mega.MegaError):
+        # request and error are only valid inside the callback
+        self.request = request.copy()
+        self.requestStr = request.getRequestString()
+        self.errorCode = error.getErrorCode()
+        self.errorStr = error.toString()
+        self.finishEvent.set()
+
+    def onRequestTemporaryError(self, api: mega.MegaApi, request: mega.MegaRequest, error: mega.MegaError):
+        self.logger.debug(f'Request Temporary Error ({request.getRequestString()}); Error: {error.toString()}')
+
+    def wait(self) -> None:
+        self.finishEvent.wait()
+
+    def isSuccess(self) -> bool:
+        return self.errorCode == mega.MegaError.API_OK
+
+
+class MegaTransferFuture(mega.MegaTransferListener):
+    def __init__(self, megaHelper: MegaHelper, uid: str, onFinish: typing.Callable = None):
+        self.megaHelper = megaHelper
+        self.logger = self.megaHelper.botHelper.loggingHelper.logger.bind(classname=self.__class__.__name__)
+        self.uid = uid
+        self.onFinish = onFinish
+        self.finishEvent = threading.Event()
+        self.nodeHandle: int = mega.INVALID_HANDLE
+        self.isOverQuota: bool = False
+        self.overQuotaWait: int = 0
+        self.errorCode: int = mega.MegaError.API_OK
+        self.errorStr: str = ''
+        self.rootTransfer: typing.List[int] = [0, 0]
+        self.subTransfers: typing.Dict[int, typing.List[int]] = {}
+        super().__init__()
+
+    @staticmethod
+    def isRootTransfer(transfer: mega.MegaTransfer) -> bool:
+        # folder transfers also report every file inside them to the same listener
+        return transfer.getFolderTransferTag() <= 0
+
+    def onTransferUpdate(self, api: mega.MegaApi, transfer: mega.MegaTransfer):
+        if self.isRootTransfer(transfer):
+            self.rootTransfer = [transfer.getTransferredBytes(), transfer.getSpeed()]
+        else:
+            self.subTransfers[transfer.getTag()] = [transfer.getTransferredBytes(), transfer.getSpeed()]
+        self.megaHelper.updateProgress(self.uid)
+
+    def onTransferTemporaryError(self, api: mega.MegaApi, transfer: mega.MegaTransfer, error: mega.MegaError):
+        self.logger.debug(f'{self.uid} : Transfer Temporary Error ({transfer.getFileName()}); Error: {error.toString()}')
+        if error.getErrorCode() == mega.MegaError.API_EOVERQUOTA and not self.isOverQuota:
+            # the sdk would just wait out the quota, cancel instead so the download moves to another account
+            self.isOverQuota = True
+            self.overQuotaWait = error.getValue()
+            api.cancelTransferByTag(transfer.getTag() if self.isRootTransfer(transfer) else transfer.getFolderTransferTag())
+
+    def onTransferFinish(self, api: mega.MegaApi, transfer: mega.MegaTransfer, error: mega.MegaError):
+        if not self.isRootTransfer(transfer):
+            self.subTransfers[transfer.getTag()] = [transfer.getTransferredBytes(), 0]
+            return
+        self.rootTransfer = [transfer.getTransferredBytes(), 0]
+        self.nodeHandle = transfer.getNodeHandle()
+        self.errorCode = error.getErrorCode()
+        self.errorStr = error.toString()
+        self.logger.debug(f'{self.uid} : Transfer Finished ({transfer.getFileName()}); Result: {self.errorStr}')
+        if self.onFinish:
+            self.onFinish()
+        self.finishEvent.set()
+
+    def transferredBytes(self) -> int:
+        return max(self.rootTransfer[0], sum([subTransfer[0] for subTransfer in self.subTransfers.values()]))
+
+    def speed(self) -> int:
+        return max(self.rootTransfer[1], sum([subTransfer[1] for subTransfer in self.subTransfers.values()]))
+
+    def wait(self) -> None:
+        self.finishEvent.wait()
+
+    def isSuccess(self) -> bool:
+        return self.errorCode == mega.MegaError.API_OK
 
 
 class MirrorInfo:
@@ -2184,6 +3999,8 @@ class MirrorInfo:
         self.tag: str = ''
         self.downloadUrl: str = ''
         self.ytdlFormat: str = botHelper.configHelper.configVars[botHelper.configHelper.optVars[7]]
+        self.compressionEngine: str = botHelper.configHelper.configVars[botHelper.configHelper.optVars[14]]
+        self.isStreamArchive: bool = (botHelper.configHelper.configVars[botHelper.configHelper.optVars[15]].lower() == 'true')
         self.sizeTotal: int = 0
         self.sizeCurrent: int = 0
         self.timeStart: float = 0.0
@@ -2206,6 +4023,7 @@ class MirrorInfo:
         self.isTelegramUpload: bool = False
         self.isCompress: bool = False
         self.isDecompress: bool = False
+        self.isSelectFiles: bool = False
 
     def resetVars(self):
         self.sizeTotal, self.sizeCurrent = 0, 0
@@ -2359,6 +4177,360 @@ class WebhookHandler(tornado.web.RequestHandler):
         self.logger.debug("%s - - %s", self.request.remote_ip, "Exception in WebhookHandler", exc_info=kwargs['exc_info'])
 
 
+class PartPipeline:
+    def __init__(self, uploadPart: typing.Callable[[str, str], None], partsOnDisk: int, uploadWorkers: int = 1, name: str = 'PartPipeline'):
+        # the producer writes parts to disk, uploadPart(partPath, partName) uploads them; never more than partsOnDisk exist at once
+        self.uploadPart = uploadPart
+        self.partSemaphore = threading.BoundedSemaphore(partsOnDisk)
+        self.uploadFailed = threading.Event()
+        self.uploadExecutor = concurrent.futures.ThreadPoolExecutor(max_workers=uploadWorkers, thread_name_prefix=name)
+        self.uploadFutures: typing.List[concurrent.futures.Future] = []
+        self.partPaths: typing.List[str] = []
+
+    def reserve(self) -> None:
+        # called before a part is written, blocks while partsOnDisk parts wait for their upload
+        self.partSemaphore.acquire()
+        if self.uploadFailed.is_set():
+            self.partSemaphore.release()
+            # the upload's own exception is raised, not a generic one
+            self.finish()
+            raise OSError('Part Upload Failed !')
+
+    def release(self) -> None:
+        # a reserved part that turned out to be empty
+        self.partSemaphore.release()
+
+    def submit(self, partPath: str, partName: str) -> None:
+        self.partPaths.append(partPath)
+        self.uploadFutures.append(self.uploadExecutor.submit(self.uploadOne, partPath, partName))
+
+    def uploadOne(self, partPath: str, partName: str) -> None:
+        try:
+            if not self.uploadFailed.is_set():
+                self.uploadPart(partPath, partName)
+        except Exception:
+            self.uploadFailed.set()
+            raise
+        finally:
+            if os.path.exists(partPath):
+                os.remove(partPath)
+            self.partSemaphore.release()
+
+    def finish(self) -> None:
+        self.uploadExecutor.shutdown(wait=True)
+        for uploadFuture in self.uploadFutures:
+            uploadFuture.result()
+
+    def abort(self) -> None:
+        # uploads still queued are skipped, the ones running are waited for so no part is removed under them
+        self.uploadFailed.set()
+        self.uploadExecutor.shutdown(wait=True)
+
+
+class FileSplitter:
+    chunkSize: int = 64 * 1024 * 1024
+
+    def __init__(self, filePath: str, partSize: int):
+        self.filePath = filePath
+        self.fileName = filePath.split('/')[-1]
+        self.fileSize = os.path.getsize(filePath)
+        self.partSize = partSize
+        self.numParts = max(1, -(-self.fileSize // self.partSize))
+
+    def partPath(self, partIndex: int) -> str:
+        return f'{self.filePath}.{str(partIndex + 1).zfill(3)}'
+
+    def writePart(self, partIndex: int) -> str:
+        partPath = self.partPath(partIndex)
+        offset = partIndex * self.partSize
+        remaining = min(self.partSize, self.fileSize - offset)
+        with open(self.filePath, 'rb') as sourceFile, open(partPath, 'wb') as partFile:
+            # sendfile() copies inside the kernel, the part never passes through python memory
+            while remaining > 0:
+                numBytes = os.sendfile(partFile.fileno(), sourceFile.fileno(), offset, min(remaining, self.chunkSize))
+                if numBytes == 0:
+                    break
+                offset += numBytes
+                remaining -= numBytes
+        return partPath
+
+
+class ArchiveStream:
+    def __init__(self, compressionHelper: CompressionHelper, sourcePath: str, compressionEngine: str,
+                 byteProgress: typing.Optional['ByteProgress'] = None):
+        self.compressionHelper = compressionHelper
+        self.byteProgress = byteProgress
+        compressCmd, archiveExt = self.compressionHelper.compressionEngines[compressionEngine]
+        self.archiveName: str = os.path.basename(sourcePath) + archiveExt
+        self.bytesRead: int = 0
+        self.writeError: typing.Optional[Exception] = None
+        self.compressProc: typing.Optional[subprocess.Popen] = None
+        # pipes hold only a few buffers, the tar writer blocks until the upload has taken what was already written
+        if compressCmd:
+            self.compressProc = subprocess.Popen(compressCmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            tarFileObj, self.stream = self.compressProc.stdin, self.compressProc.stdout
+        else:
+            readFd, writeFd = os.pipe()
+            tarFileObj, self.stream = open(writeFd, 'wb'), open(readFd, 'rb')
+        self.writeThread = threading.Thread(target=self.writeTar, name=f'{self.archiveName}-writeTar', daemon=True,
+                                            args=(sourcePath, tarFileObj, ('w|gz' if compressionEngine == 'gzip' else 'w|')))
+        self.writeThread.start()
+
+    def writeTar(self, sourcePath: str, tarFileObj: typing.BinaryIO, tarMode: str) -> None:
+        try:
+            self.compressionHelper.writeTar(sourcePath, tarFileObj, tarMode, self.byteProgress)
+        except Exception as writeError:
+            self.writeError = writeError
+        finally:
+            tarFileObj.close()
+
+    def read(self, size: int) -> bytes:
+        streamChunk = self.stream.read(size)
+        self.bytesRead += len(streamChunk)
+        return streamChunk
+
+    def close(self) -> None:
+        self.stream.close()
+        self.writeThread.join()
+        returnCode = (self.compressProc.wait() if self.compressProc else 0)
+        if self.writeError:
+            raise OSError(f"Writing Tar Failed: {self.writeError}")
+        if returnCode != 0:
+            raise OSError(f"Compressor Exited With Code {returnCode}")
+
+    def abort(self) -> None:
+        if self.compressProc:
+            self.compressProc.kill()
+        try:
+            self.close()
+        except (OSError, ValueError):
+            pass
+
+
+class VolumeWriter:
+    def __init__(self, volumeDir: str, archiveName: str, volumeSize: int):
+        self.volumeDir = volumeDir
+        self.archiveName = archiveName
+        self.volumeSize = volumeSize
+        self.volumePaths: typing.List[str] = []
+        self.volumeFile: typing.Optional[typing.BinaryIO] = None
+        self.volumeLeft: int = 0
+        os.makedirs(self.volumeDir, exist_ok=True)
+
+    def write(self, data: bytes) -> int:
+        dataView = memoryview(data)
+        while dataView:
+            if self.volumeLeft == 0:
+                self.nextVolume()
+            writeSize = min(self.volumeLeft, len(dataView))
+            self.volumeFile.write(dataView[:writeSize])
+            dataView = dataView[writeSize:]
+            self.volumeLeft -= writeSize
+        return len(data)
+
+    def nextVolume(self) -> None:
+        # a volume is closed as soon as it is full, so only the one being written is open
+        if self.volumeFile:
+            self.volumeFile.close()
+        volumePath = os.path.join(self.volumeDir, f'{self.archiveName}.{str(len(self.volumePaths) + 1).zfill(3)}')
+        self.volumeFile = open(volumePath, 'wb')
+        self.volumePaths.append(volumePath)
+        self.volumeLeft = self.volumeSize
+
+    def close(self) -> None:
+        if self.volumeFile:
+            self.volumeFile.close()
+            self.volumeFile = None
+
+
+class StreamMediaUpload(googleapiclient.http.MediaUpload):
+    def __init__(self, archiveStream: ArchiveStream, mimeType: str, chunkSize: int):
+        super().__init__()
+        self.archiveStream = archiveStream
+        self.mimeType = mimeType
+        self.chunkSize = chunkSize
+        # a chunk may be requested again after a failed request, so it is kept until the upload has moved past it
+        self.buffer: bytes = b''
+        self.bufferStart: int = 0
+
+    def chunksize(self) -> int:
+        return self.chunkSize
+
+    def mimetype(self) -> str:
+        return self.mimeType
+
+    def size(self) -> None:
+        # unknown until the stream ends, the resumable upload then sends the final size with the last chunk
+        return None
+
+    def resumable(self) -> bool:
+        return True
+
+    def has_stream(self) -> bool:
+        return False
+
+    def getbytes(self, begin: int, length: int) -> bytes:
+        self.buffer = self.buffer[(begin - self.bufferStart):]
+        self.bufferStart = begin
+        while len(self.buffer) < length:
+            streamChunk = self.archiveStream.read(length - len(self.buffer))
+            if not streamChunk:
+                break
+            self.buffer += streamChunk
+        return self.buffer[:length]
+
+
+class TelegramUploadBot:
+    def __init__(self, bot: telegram.Bot):
+        self.bot = bot
+        self.activeUploads: int = 0
+        self.chatAccess: typing.Dict[int, bool] = {}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens: float = capacity
+        self.timeLast: float = time.monotonic()
+        self.pausedUntil: float = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                timeNow = time.monotonic()
+                if timeNow >= self.pausedUntil:
+                    self.tokens = min(self.capacity, self.tokens + ((timeNow - self.timeLast) * self.rate))
+                    self.timeLast = timeNow
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    waitTime = (1 - self.tokens) / self.rate
+                else:
+                    waitTime = self.pausedUntil - timeNow
+            time.sleep(waitTime)
+
+    def pause(self, seconds: float) -> None:
+        # a flood wait applies to every sender of the chat, not just the one who hit it
+        with self.lock:
+            self.pausedUntil = max(self.pausedUntil, time.monotonic() + seconds)
+            # nothing refills during the pause, but the first send may go out as soon as it ends
+            self.timeLast = self.pausedUntil
+            self.tokens = 1
+
+
+class YouTubeProgressHook:
+    def __init__(self, botHelper: BotHelper, mirrorInfo: 'MirrorInfo'):
+        self.botHelper = botHelper
+        self.mirrorInfo = mirrorInfo
+        self.logger = self.botHelper.loggingHelper.logger.bind(classname=self.__class__.__name__)
+        self.updateInterval = float(self.botHelper.configHelper.configVars[self.botHelper.configHelper.optVars[5]])
+        self.fileInfos: typing.Dict[str, typing.Dict[str, int]] = {}
+        # final file path : [format part paths, number of formats finished]
+        self.videoFormats: typing.Dict[str, typing.List[typing.Any]] = {}
+        self.timeLast: float = 0.0
+        self.isCompleted: bool = False
+        self.lock = threading.Lock()
+
+    def __call__(self, progressUpdate: dict) -> None:
+        sizeTotal = int(progressUpdate.get('total_bytes') or progressUpdate.get('total_bytes_estimate') or 0)
+        isFinished = (progressUpdate['status'] == 'finished')
+        self.updateFile(progressUpdate['filename'], {'sizeTotal': sizeTotal,
+                                                     'sizeCurrent': (sizeTotal if isFinished else int(progressUpdate.get('downloaded_bytes') or 0)),
+                                                     'speedCurrent': (0 if isFinished else int(progressUpdate.get('speed') or 0))}, isFinished)
+
+    def addVideo(self, filePath: str, formatPaths: typing.List[str]) -> None:
+        with self.lock:
+            self.videoFormats[filePath] = [formatPaths, 0]
+
+    def updateFile(self, fileKey: str, fileInfo: typing.Dict[str, int], isFinished: bool) -> None:
+        with self.lock:
+            # one entry per file, concurrent entries and separate video / audio formats add up instead of overwriting each other
+            isNewFinish = (isFinished and not self.fileInfos.get(fileKey, {}).get('isFinished'))
+            self.fileInfos[fileKey] = {**fileInfo, 'isFinished': isFinished}
+            if isNewFinish:
+                self.formatFinished(fileKey)
+            # status messages only refresh every updateInterval, more frequent updates would never be seen
+            if not isFinished and time.time() - self.timeLast < self.updateInterval:
+                return
+            self.updateVars()
+
+    def formatFinished(self, fileKey: str) -> None:
+        for filePath, videoFormat in self.videoFormats.items():
+            if fileKey in videoFormat[0]:
+                videoFormat[1] += 1
+                if len(videoFormat[0]) > 1 and videoFormat[1] == len(videoFormat[0]):
+                    self.logger.info(f"{self.mirrorInfo.uid} : Merging Formats: '{os.path.basename(filePath)}'")
+                return
+
+    def videoDone(self, filePath: str) -> None:
+        with self.lock:
+            self.videoFormats.pop(filePath, None)
+
+    def updateVars(self) -> None:
+        self.timeLast = time.time()
+        self.mirrorInfo.updateVars({MirrorInfo.updatableVars[0]: sum([fileInfo['sizeTotal'] for fileInfo in self.fileInfos.values()]),
+                                    MirrorInfo.updatableVars[1]: sum([fileInfo['sizeCurrent'] for fileInfo in self.fileInfos.values()]),
+                                    MirrorInfo.updatableVars[2]: sum([fileInfo['speedCurrent'] for fileInfo in self.fileInfos.values()]),
+                                    MirrorInfo.updatableVars[3]: self.timeLast})
+
+    def complete(self) -> None:
+        with self.lock:
+            # fires once, after every video of the job is downloaded and merged
+            if self.isCompleted:
+                return
+            self.isCompleted = True
+            self.updateVars()
+        self.botHelper.mirrorListenerHelper.updateStatus(self.mirrorInfo.uid, MirrorStatus.downloadComplete)
+
+
+class ByteProgress:
+    def __init__(self, mirrorInfo: 'MirrorInfo', sizeTotal: int, updateInterval: float):
+        self.mirrorInfo = mirrorInfo
+        self.updateInterval = updateInterval
+        self.sizeCurrent: int = 0
+        self.sizeLast: int = 0
+        self.timeLast: float = time.time()
+        self.progressLock = threading.Lock()
+        self.mirrorInfo.updateVars({MirrorInfo.updatableVars[0]: sizeTotal})
+
+    def update(self, sizeUpdate: int) -> None:
+        # parallel zip extraction counts from several threads
+        with self.progressLock:
+            self.sizeCurrent += sizeUpdate
+            timeCurrent = time.time()
+            # counting is a single addition per read, mirrorInfo is only touched once per status interval
+            if timeCurrent - self.timeLast >= self.updateInterval:
+                self.pushVars(timeCurrent)
+
+    def complete(self) -> None:
+        with self.progressLock:
+            self.pushVars(time.time())
+
+    def pushVars(self, timeCurrent: float) -> None:
+        speedCurrent = int((self.sizeCurrent - self.sizeLast) / max(timeCurrent - self.timeLast, 0.001))
+        self.mirrorInfo.updateVars({MirrorInfo.updatableVars[1]: self.sizeCurrent,
+                                    MirrorInfo.updatableVars[2]: speedCurrent,
+                                    MirrorInfo.updatableVars[3]: timeCurrent})
+        self.sizeLast, self.timeLast = self.sizeCurrent, timeCurrent
+
+
+class ProgressReader:
+    def __init__(self, fileObj: typing.BinaryIO, byteProgress: ByteProgress):
+        self.fileObj = fileObj
+        self.byteProgress = byteProgress
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileObj.read(size)
+        self.byteProgress.update(len(data))
+        return data
+
+    def __getattr__(self, attrName: str) -> typing.Any:
+        # seek(), tell() and the rest go to the wrapped file, zipfile needs them
+        return getattr(self.fileObj, attrName)
+
+
 class DirectDownloadLinkException(Exception):
     pass
 